@@ -1,39 +1,17 @@
 """modern_python_demo package
 
-Eager-import core submodules so tooling and `__all__` work nicely for demos
-and tests.
-"""
-"""modern_python_demo package
-
 This package exposes a collection of modules that demonstrate modern Python
 features for educational purposes. Use ``python -m modern_python_demo`` to run
 the demo.
-"""
-from importlib.metadata import version as _version
-
-__all__ = [
-    "decorators",
-    "metaclasses",
-    "models",
-    "events",
-    "plugins",
-    "cache",
-    "serialization",
-    "introspect",
-    "pipelines",
-    "config",
-    "errors",
-]
 
-try:
-    __version__ = _version("modern_python_demo")
-except Exception:
-    __version__ = "0.0.0"
+Submodules are imported lazily on attribute access so package import stays
+cheap; ``__version__`` comes from a generated module rather than an
+``importlib.metadata`` lookup for the same reason.
+"""
+import importlib
+from typing import Any
 
-# Do not import submodules eagerly; allow consumers/tests to import specific
-# modules (e.g. `from modern_python_demo import cache`) or use `import
-# modern_python_demo.cache` so import side-effects are minimized during test
-# collection and packaging.
+from ._version import __version__
 
 # Expose names but import submodules lazily to avoid import-time cycles and to
 # keep package import lightweight for tooling and tests.
@@ -52,10 +30,6 @@ __all__ = [
     "__version__",
 ]
 
-import importlib
-from types import ModuleType
-from typing import Any
-
 
 def __getattr__(name: str) -> Any:
     if name in __all__:
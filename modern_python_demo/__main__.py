@@ -1,11 +1,90 @@
-"""Module entrypoint so the package can be run with `python -m modern_python_demo`."""
+"""Module entrypoint so the package can be run with `python -m modern_python_demo`.
+
+    python -m modern_python_demo          # run the feature demo
+    python -m modern_python_demo load     # run the broker/scheduler load test
+    python -m modern_python_demo supervise --tasks 100   # run DemoTasks across processes
+"""
 from __future__ import annotations
 
-from .main import main
 import asyncio
+from typing import List, Optional
+
+
+def _parse_args(argv: Optional[List[str]]):
+    # deferred so that importing this module stays as cheap as possible
+    import argparse
+
+    p = argparse.ArgumentParser(prog="python -m modern_python_demo")
+    p.add_argument("--memory-report", action="store_true", help="trace allocations and print a memory report at exit")
+    p.add_argument("--profile", metavar="PATH", help="sample stacks while running and write collapsed stacks to PATH")
+    sub = p.add_subparsers(dest="command")
+    sub.add_parser("demo", help="run the feature demo (default)")
+    load = sub.add_parser("load", help="drive DemoTask.run through EventBroker and report capacity")
+    load.add_argument("--concurrency", type=int, default=10, help="concurrent task runners")
+    load.add_argument("--rate", type=float, default=0.0, help="target tasks/s overall (0 = as fast as possible)")
+    load.add_argument("--duration", type=float, default=5.0, help="seconds to run")
+    load.add_argument("--mix", default="sync=1,async=1", help="handlers per event, e.g. sync=2,async=1,slow=1")
+    load.add_argument("--slow-delay", type=float, default=0.05, help="sleep of each slow handler (s)")
+    sup = sub.add_parser("supervise", help="run DemoTasks across worker processes")
+    sup.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    sup.add_argument("--tasks", type=int, default=100, help="number of DemoTasks to run")
+    sup.add_argument("--concurrency", type=int, default=4, help="tasks run at once per worker")
+    return p.parse_args(argv)
+
+
+def _run(argv: Optional[List[str]] = None) -> None:
+    args = _parse_args(argv)
+    from .errors import configure_logging
+
+    configure_logging()
+    if args.memory_report:
+        from . import memory
+
+        memory.start_tracing()
+        baseline = memory.take_snapshot()
+    if args.profile:
+        from .profiler import SamplingProfiler
+
+        profiler = SamplingProfiler().start()
+    try:
+        _dispatch(args)
+    finally:
+        if args.profile:
+            profiler.stop()
+            profiler.write_collapsed(args.profile)
+            print(f"wrote {profiler.sample_count} samples to {args.profile} (overhead {profiler.overhead:.2%})")
+        if args.memory_report:
+            print(memory.memory_report(baseline=baseline))
+
+
+def _dispatch(args) -> None:
+    if args.command == "load":
+        from .loadgen import parse_mix, run_load
+
+        report = asyncio.run(
+            run_load(
+                concurrency=args.concurrency,
+                rate=args.rate,
+                duration=args.duration,
+                mix=parse_mix(args.mix),
+                slow_delay=args.slow_delay,
+            )
+        )
+        print(report.format())
+        return
+    if args.command == "supervise":
+        from .main import DemoTask
+        from .supervisor import Supervisor
+
+        sup = Supervisor(args.workers, concurrency=args.concurrency)
+        result = sup.run(DemoTask(f"task-{i}") for i in range(args.tasks))
+        print(f"completed {result.completed}, failed {result.failed}, restarts {result.restarts} in {result.elapsed:.2f}s")
+        for pid, m in sorted(result.workers.items()):
+            print(f"  worker {m['worker']} (pid {pid}): {m['tasks_done']} done, {m['errors']} errors, busy {m['busy_time']:.2f}s")
+        return
 
+    from .main import main
 
-def _run() -> None:
     asyncio.run(main())
 
 
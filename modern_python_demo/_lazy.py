@@ -0,0 +1,22 @@
+"""Deferred imports for optional, slow-to-import dependencies."""
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Dict, Optional
+
+_MISSING: Dict[str, bool] = {}
+
+
+def optional_module(name: str) -> Optional[ModuleType]:
+    """Import ``name`` on first use, returning ``None`` if it is not installed.
+
+    A failed import is remembered so it is not retried on every call.
+    """
+    if name in _MISSING:
+        return None
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        _MISSING[name] = True
+        return None
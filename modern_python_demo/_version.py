@@ -0,0 +1,2 @@
+"""Package version, kept in sync with pyproject.toml by tools/bump_version.py."""
+__version__ = "0.1.0"
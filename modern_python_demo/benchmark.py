@@ -0,0 +1,284 @@
+"""Micro-benchmarks for the package's hot paths, with stored baselines.
+
+Run ``python -m modern_python_demo.benchmark --save`` once to record a
+baseline, then ``python -m modern_python_demo.benchmark`` to compare the
+current tree against it; the exit status is 1 when any case's median latency
+regressed by more than ``--threshold``. Everything runs offline, in-process.
+
+Latencies are round means: each timed round runs an operation ``number``
+times and contributes one sample (round time / ``number``), so p50/p90/p99
+are percentiles across rounds, not across individual calls. That keeps timer
+overhead out of sub-microsecond cases, but tail latency of single calls is
+averaged away, and with few rounds p99 is close to the slowest round.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BASELINE = ".benchmarks/baseline.json"
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Return the ``q`` quantile (0..1) of ``samples`` by linear interpolation."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    pos = (len(ordered) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+@dataclass
+class BenchResult:
+    """Per-operation latency statistics (seconds) and throughput (ops/s).
+
+    ``p50``/``p90``/``p99`` are percentiles of the per-round mean latency;
+    ``samples`` is the number of rounds.
+    """
+
+    name: str
+    ops_per_sec: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    samples: int
+
+
+def measure(
+    name: str,
+    op: Callable[[], Any],
+    *,
+    number: int = 100,
+    repeat: int = 20,
+    warmup: int = 2,
+) -> BenchResult:
+    """Time ``op``: ``warmup`` discarded rounds, then ``repeat`` rounds of ``number`` calls.
+
+    Each round yields one sample: the mean per-call latency (round time / ``number``).
+    """
+    for _ in range(warmup):
+        for _ in range(number):
+            op()
+    samples: List[float] = []
+    clock = time.perf_counter
+    for _ in range(repeat):
+        start = clock()
+        for _ in range(number):
+            op()
+        samples.append((clock() - start) / number)
+    mean = sum(samples) / len(samples)
+    return BenchResult(
+        name=name,
+        ops_per_sec=1.0 / mean if mean else float("inf"),
+        mean=mean,
+        p50=percentile(samples, 0.5),
+        p90=percentile(samples, 0.9),
+        p99=percentile(samples, 0.99),
+        samples=len(samples),
+    )
+
+
+# -- benchmark cases ---------------------------------------------------------
+# Each case factory takes an input size and returns a zero-argument callable,
+# or an ``(op, cleanup)`` pair when the case holds resources that must be
+# released after measuring.
+
+
+def _emit_case(size: int) -> Tuple[Callable[[], Any], Callable[[], None]]:
+    from .events import EventBroker
+
+    broker = EventBroker()
+
+    async def handler(event: str, payload: Any) -> None:
+        return None
+
+    for _ in range(size):
+        broker.subscribe("bench", handler)
+    loop = asyncio.new_event_loop()
+    return (lambda: loop.run_until_complete(broker.emit("bench", 1))), loop.close
+
+
+def _compose_case(size: int) -> Callable[[], Any]:
+    from .pipelines import compose, filter_even, multiply
+
+    pipeline = compose(filter_even(), multiply(factor=3))
+    data = range(size)
+    return lambda: list(pipeline(data))
+
+
+def _memoize_case(size: int) -> Callable[[], Any]:
+    from .decorators import memoize_with_limit
+
+    @memoize_with_limit(size)
+    def square(n: int) -> int:
+        return n * n
+
+    keys = list(range(size))
+    for k in keys:
+        square(k)
+    return lambda: [square(k) for k in keys]
+
+
+def _fib_case(size: int) -> Callable[[], Any]:
+    from .cache import fib
+
+    def run() -> int:
+        fib.cache_clear()
+        return fib(size)
+
+    return run
+
+
+def _payload(size: int) -> Dict[str, Any]:
+    return {f"k{i}": {"id": i, "name": f"item-{i}", "tags": ["a", "b"], "score": i / 3} for i in range(size)}
+
+
+def _json_case(size: int) -> Callable[[], Any]:
+    from .serialization import dumps_json, loads_json
+
+    obj = _payload(size)
+    return lambda: loads_json(dumps_json(obj))
+
+
+def _pickle_case(size: int) -> Callable[[], Any]:
+    from .serialization import dumps_pickle, loads_pickle
+
+    obj = _payload(size)
+    return lambda: loads_pickle(dumps_pickle(obj))
+
+
+def _yaml_case(size: int) -> Callable[[], Any]:
+    from ._lazy import optional_module
+    from .serialization import dumps_yaml, loads_yaml
+
+    if optional_module("yaml") is None:
+        raise RuntimeError("PyYAML not installed")
+    obj = _payload(size)
+    return lambda: loads_yaml(dumps_yaml(obj))
+
+
+# name -> (factory, default sizes)
+CASES: Dict[str, Any] = {
+    "events.emit": (_emit_case, (1, 10, 100)),
+    "pipelines.compose": (_compose_case, (100, 10_000)),
+    "decorators.memoize_with_limit": (_memoize_case, (16, 256)),
+    "cache.fib": (_fib_case, (50, 300)),
+    "serialization.json": (_json_case, (10, 1000)),
+    "serialization.pickle": (_pickle_case, (10, 1000)),
+    "serialization.yaml": (_yaml_case, (10, 100)),
+}
+
+
+def run_suite(
+    cases: Optional[Iterable[str]] = None,
+    *,
+    sizes: Optional[Sequence[int]] = None,
+    number: int = 20,
+    repeat: int = 10,
+    warmup: int = 2,
+) -> Dict[str, BenchResult]:
+    """Run the selected cases (all by default) at each size; results are keyed ``case[size]``."""
+    results: Dict[str, BenchResult] = {}
+    for case in cases or CASES:
+        factory, default_sizes = CASES[case]
+        for size in sizes or default_sizes:
+            try:
+                op = factory(size)
+            except RuntimeError as e:
+                # e.g. PyYAML not installed
+                print(f"skipping {case}: {e}")
+                break
+            cleanup: Optional[Callable[[], None]] = None
+            if isinstance(op, tuple):
+                op, cleanup = op
+            name = f"{case}[{size}]"
+            try:
+                results[name] = measure(name, op, number=number, repeat=repeat, warmup=warmup)
+            finally:
+                if cleanup is not None:
+                    cleanup()
+    return results
+
+
+def save_baseline(results: Dict[str, BenchResult], path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    doc = {
+        "meta": {"python": sys.version.split()[0], "platform": platform.platform(), "created": time.time()},
+        "results": {name: asdict(r) for name, r in results.items()},
+    }
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(doc, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, BenchResult]:
+    with open(path, "r", encoding="utf8") as f:
+        doc = json.load(f)
+    return {name: BenchResult(**r) for name, r in doc["results"].items()}
+
+
+def compare(
+    current: Dict[str, BenchResult], baseline: Dict[str, BenchResult], threshold: float = 0.10
+) -> List[str]:
+    """Return a message for every case whose round-mean p50 is more than ``threshold`` slower than baseline."""
+    regressions: List[str] = []
+    for name, now in current.items():
+        base = baseline.get(name)
+        if base is None or not base.p50:
+            continue
+        change = now.p50 / base.p50 - 1.0
+        if change > threshold:
+            regressions.append(f"{name}: p50 {base.p50 * 1e6:.1f}us -> {now.p50 * 1e6:.1f}us (+{change:.0%})")
+    return regressions
+
+
+def _print_results(results: Dict[str, BenchResult]) -> None:
+    print("latency percentiles are across per-round mean latencies")
+    print(f"{'case':40} {'ops/s':>12} {'p50 us':>10} {'p90 us':>10} {'p99 us':>10}")
+    for r in results.values():
+        print(f"{r.name:40} {r.ops_per_sec:12.0f} {r.p50 * 1e6:10.1f} {r.p90 * 1e6:10.1f} {r.p99 * 1e6:10.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("cases", nargs="*", help=f"cases to run (default: all of {', '.join(CASES)})")
+    p.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")], help="comma-separated input sizes")
+    p.add_argument("--number", type=int, default=20, help="calls per timed round")
+    p.add_argument("--repeat", type=int, default=10, help="timed rounds per case")
+    p.add_argument("--warmup", type=int, default=2, help="untimed rounds per case")
+    p.add_argument("--baseline", default=DEFAULT_BASELINE)
+    p.add_argument("--save", action="store_true", help="write results as the new baseline")
+    p.add_argument("--threshold", type=float, default=0.10, help="allowed p50 slowdown (0.10 = 10%%)")
+    args = p.parse_args(argv)
+    unknown = sorted(set(args.cases) - CASES.keys())
+    if unknown:
+        p.error(f"unknown case(s): {', '.join(unknown)}")
+
+    results = run_suite(args.cases, sizes=args.sizes, number=args.number, repeat=args.repeat, warmup=args.warmup)
+    _print_results(results)
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        print(f"no baseline at {args.baseline}; run with --save first")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+    for msg in regressions:
+        print("REGRESSION", msg)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,18 @@
-"""Configuration system: dataclass-based config, YAML loading, context manager for temporary overrides."""
+"""Configuration system: dataclass-based config, YAML loading, context manager for temporary overrides.
+
+The *current* config lives in a :class:`contextvars.ContextVar`, so overrides
+pushed with :func:`temp_config` are visible to everything running inside the
+same task and to any child tasks created while the override is active.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from contextvars import ContextVar
+from dataclasses import FrozenInstanceError, dataclass, fields, replace
 from typing import Any, Dict, Iterator, Optional, ContextManager
 from contextlib import contextmanager
 
-try:
-    import yaml
-except Exception:
-    yaml = None
+from ._lazy import optional_module
+from .errors import ConfigError
 
 
 @dataclass(frozen=True)
@@ -22,17 +26,142 @@ class Config:
         return replace(self, **kwargs)
 
 
+_FIELD_NAMES = frozenset(f.name for f in fields(Config))
+
+
+class _ConfigLayer:
+    """One override layer on top of a parent layer.
+
+    A layer only stores the keys it overrides, so pushing one is
+    O(len(overrides)). The merged settings are built on first lookup as a
+    flat dict and cached, so every lookup afterwards is a single dict access;
+    the :class:`Config` object itself is only built (and cached) when someone
+    asks for the whole object.
+    """
+
+    __slots__ = ("parent", "overrides", "_flat", "_view")
+
+    def __init__(self, parent: Optional["_ConfigLayer"], overrides: Dict[str, Any], view: Optional[Config] = None) -> None:
+        self.parent = parent
+        self.overrides = overrides
+        self._view = view
+        self._flat: Optional[Dict[str, Any]] = None
+        if view is not None:
+            self._flat = {f.name: getattr(view, f.name) for f in fields(Config)}
+
+    def flat(self) -> Dict[str, Any]:
+        flat = self._flat
+        if flat is None:
+            assert self.parent is not None
+            flat = self._flat = {**self.parent.flat(), **self.overrides}
+        return flat
+
+    def resolve(self) -> Config:
+        view = self._view
+        if view is None:
+            view = self._view = Config(**self.flat())
+        return view
+
+
+class ConfigView:
+    """Lazily merged stand-in for a :class:`Config`, yielded by :func:`temp_config`.
+
+    Settings are read from the layer's cached flat dict, so no ``Config`` is
+    built for attribute access. Otherwise it behaves like the ``Config`` that
+    :func:`current_config` returns for the same layer: it compares equal to
+    it, passes ``isinstance(view, Config)`` and works with ``vars``,
+    ``dataclasses.asdict`` and ``dataclasses.replace``. :meth:`resolve`
+    returns the real object.
+    """
+
+    __slots__ = ("_layer",)
+    # lets dataclasses.asdict/replace/fields treat the view like a Config
+    __dataclass_fields__ = Config.__dataclass_fields__
+    __dataclass_params__ = Config.__dataclass_params__
+
+    def __init__(self, layer: _ConfigLayer) -> None:
+        self._layer = layer
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._layer.flat()[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != "_layer":
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        object.__setattr__(self, name, value)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> type:
+        # isinstance(view, Config) is True, and dataclasses.replace builds a Config
+        return Config
+
+    @property
+    def __dict__(self) -> Dict[str, Any]:  # type: ignore[override]
+        return dict(self._layer.flat())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Config, ConfigView)):
+            return self._layer.flat() == {name: getattr(other, name) for name in _FIELD_NAMES}
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+    def resolve(self) -> Config:
+        return self._layer.resolve()
+
+    def with_override(self, **kwargs) -> Config:
+        return replace(self.resolve(), **kwargs)
+
+    def __repr__(self) -> str:
+        return repr(self.resolve())
+
+
+_ROOT = _ConfigLayer(None, {}, Config())
+_current: ContextVar[_ConfigLayer] = ContextVar("modern_python_demo_config", default=_ROOT)
+
+
+def current_config() -> Config:
+    """Return the config visible in the current context."""
+    return _current.get().resolve()
+
+
+def get_setting(name: str) -> Any:
+    """Look up a single setting from the current config."""
+    try:
+        return _current.get().flat()[name]
+    except KeyError:
+        raise ConfigError(f"unknown config field: {name!r}") from None
+
+
 @contextmanager
-def temp_config(cfg: Config, **overrides) -> Iterator[Config]:
-    """Temporarily yield an overridden config inside a context manager."""
-    new = cfg.with_override(**overrides)
+def temp_config(cfg: Optional[Config] = None, **overrides) -> Iterator[Config]:
+    """Push an override layer for the duration of the ``with`` block.
+
+    With no ``cfg`` the overrides stack on top of the current context's config;
+    passing ``cfg`` layers them on top of that config instead. Inside the
+    block (including in tasks spawned from it) :func:`current_config` and
+    :func:`get_setting` see the merged settings. The value yielded is a
+    :class:`ConfigView` standing in for that merged ``Config``; pushing the
+    layer copies nothing, and a real ``Config`` is only built if asked for.
+    """
+    unknown = overrides.keys() - _FIELD_NAMES
+    if unknown:
+        raise ConfigError(f"unknown config field(s): {', '.join(sorted(unknown))}")
+    parent = _current.get() if cfg is None else _ConfigLayer(None, {}, cfg)
+    layer = _ConfigLayer(parent, overrides) if overrides else parent
+    token = _current.set(layer)
     try:
-        yield new
+        yield ConfigView(layer)  # type: ignore[misc]
     finally:
-        pass
+        _current.reset(token)
 
 
 def load_from_yaml(path: str) -> Dict[str, Any]:
+    yaml = optional_module("yaml")
     if yaml is None:
         raise RuntimeError("PyYAML not installed")
     with open(path, "r", encoding="utf8") as f:
@@ -11,9 +11,13 @@ from __future__ import annotations
 from functools import wraps, partial
 from typing import Callable, Any, Optional, TypeVar, Dict
 import time
+import weakref
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# live memoize_with_limit wrappers, for memory accounting (see memory.py)
+_memoized: "weakref.WeakSet[Callable[..., Any]]" = weakref.WeakSet()
+
 
 def timed(label: Optional[str] = None):
     """Parameterized decorator that measures execution time.
@@ -78,6 +82,8 @@ def memoize_with_limit(maxsize: int = 128):
             return {"size": len(cache), "maxsize": maxsize}
 
         wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+        wrapper._cache = cache  # type: ignore[attr-defined]
+        _memoized.add(wrapper)
         return wrapper  # type: ignore
 
     return deco
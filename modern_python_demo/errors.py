@@ -1,17 +1,31 @@
-"""Hierarchical exceptions and logging setup."""
+"""Hierarchical exceptions and logging setup.
+
+Importing this module only attaches a ``NullHandler``; call
+:func:`configure_logging` to start the background logging pipeline. Records
+are handed to a ``QueueHandler`` (formatting is deferred to the listener
+thread) and a :class:`RateLimitFilter` drops repeats of the same message
+beyond a small burst. Suppressed counts are reported on the next matching
+record that gets through, or, if none comes, by a summary record that the
+listener thread writes within about one ``interval`` of the window expiring
+(even if nothing else is logged), and at the latest when logging is shut down.
+"""
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import Optional
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Callable, Dict, Hashable, List, Optional, TextIO
 
 
 logger = logging.getLogger("modern_python_demo")
-handler = logging.StreamHandler()
-formatter = logging.Formatter("[%(levelname)s] %(name)s - %(message)s")
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+logger.addHandler(logging.NullHandler())
 logger.setLevel(logging.INFO)
 
+DEFAULT_FORMAT = "[%(levelname)s] %(name)s - %(message)s"
+
 
 class DemoError(Exception):
     """Base exception for the demo."""
@@ -29,11 +43,213 @@ class SerializationError(DemoError):
     """Serialization / deserialization issues."""
 
 
+class IPCError(DemoError):
+    """Errors reported by the other side of an IPC connection."""
+
+
+class RateLimitFilter(logging.Filter):
+    """Let through at most ``burst`` records per message key every ``interval`` seconds.
+
+    The key is the record's ``dedup_key`` attribute if set (pass it via
+    ``extra=``), otherwise the logger name, level and unformatted message, so
+    the check never formats the message. The first record let through after a
+    suppression carries the count in ``record.suppressed``; counts that no
+    later record picks up are returned by :meth:`collect_suppressed` as
+    summary records (a copy of the last suppressed record with ``suppressed``
+    set), which the pipeline emits when the window expires or at shutdown.
+    """
+
+    def __init__(self, burst: int = 5, interval: float = 10.0, max_keys: int = 1024) -> None:
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        self.max_keys = max_keys
+        # key -> [window start, records passed in window, suppressed since last pass, last suppressed record]
+        self._windows: Dict[Hashable, List[Any]] = {}
+        # summaries for keys evicted while they still had suppressed records
+        self._evicted: List[logging.LogRecord] = []
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+
+    def _key(self, record: logging.LogRecord) -> Hashable:
+        key = getattr(record, "dedup_key", None)
+        if key is None:
+            key = (record.name, record.levelno, str(record.msg))
+        return key
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = self._key(record)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                if len(self._windows) >= self.max_keys:
+                    # drop the oldest key (dicts keep insertion order)
+                    oldest = self._windows.pop(next(iter(self._windows)))
+                    if oldest[2]:
+                        self._evicted.append(self._summary(oldest))
+                window = self._windows[key] = [now, 0, 0, None]
+            elif now - window[0] >= self.interval:
+                window[0], window[1] = now, 0
+            if window[1] >= self.burst:
+                window[2] += 1
+                window[3] = record
+                return False
+            window[1] += 1
+            record.suppressed, window[2], window[3] = window[2], 0, None
+        return True
+
+    @staticmethod
+    def _summary(window: List[Any]) -> logging.LogRecord:
+        summary = logging.makeLogRecord(window[3].__dict__)
+        summary.suppressed = window[2]
+        window[2], window[3] = 0, None
+        return summary
+
+    def collect_suppressed(self, force: bool = False) -> List[logging.LogRecord]:
+        """Return summary records for suppressed counts whose window has expired.
+
+        With ``force`` every pending count is returned regardless of its
+        window. Without it the windows are scanned at most once per
+        ``interval``, so calling this for every record is cheap.
+        """
+        now = time.monotonic()
+        with self._lock:
+            out, self._evicted = self._evicted, []
+            if not force and now < self._next_sweep:
+                return out
+            self._next_sweep = now + self.interval
+            for window in self._windows.values():
+                if window[2] and (force or now - window[0] >= self.interval):
+                    out.append(self._summary(window))
+        return out
+
+
+class SuppressionFormatter(logging.Formatter):
+    """Formatter that appends the suppressed-duplicates count, if any."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            text += f" (suppressed {suppressed} similar message{'s' if suppressed != 1 else ''})"
+        return text
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread.
+
+    The stock ``prepare`` formats the message in the caller's thread so the
+    record can be pickled; our queue never leaves the process, so the record
+    is enqueued untouched.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        passed = super().handle(record)
+        self.emit_suppressed()
+        return passed
+
+    def emit_suppressed(self, force: bool = False) -> None:
+        """Enqueue the rate limiters' pending suppression summaries (bypassing the filters)."""
+        for f in self.filters:
+            if isinstance(f, RateLimitFilter):
+                for summary in f.collect_suppressed(force):
+                    self.emit(summary)
+
+
+class _SweepingQueueListener(QueueListener):
+    """QueueListener that writes pending suppression summaries while the queue is idle.
+
+    ``dequeue`` waits at most ``sweep_interval`` for a record; on each timeout
+    ``collect`` is asked for summaries, which are handled right here on the
+    listener thread, so a quiet process still reports suppressed counts.
+    """
+
+    def __init__(
+        self,
+        records: Any,
+        *handlers: logging.Handler,
+        collect: Callable[[], List[logging.LogRecord]],
+        sweep_interval: float,
+        respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(records, *handlers, respect_handler_level=respect_handler_level)
+        self._collect = collect
+        self._sweep_interval = sweep_interval
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if not block:
+            return super().dequeue(block)
+        while True:
+            try:
+                return self.queue.get(timeout=self._sweep_interval)
+            except queue.Empty:
+                for summary in self._collect():
+                    self.handle(summary)
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    *,
+    stream: Optional[TextIO] = None,
+    fmt: str = DEFAULT_FORMAT,
+    burst: int = 5,
+    interval: float = 10.0,
+) -> QueueListener:
+    """Route the package logger through a background queue listener.
+
+    Calling it again replaces the previous pipeline. The listener is stopped
+    (and the queue flushed) at interpreter exit or by :func:`shutdown_logging`.
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(SuppressionFormatter(fmt))
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    limiter = RateLimitFilter(burst, interval)
+    _queue_handler = _DeferredQueueHandler(records)
+    _queue_handler.addFilter(limiter)
+    _listener = _SweepingQueueListener(
+        records,
+        handler,
+        collect=limiter.collect_suppressed,
+        sweep_interval=max(interval, 0.01),
+        respect_handler_level=True,
+    )
+    logger.addHandler(_queue_handler)
+    logger.setLevel(level)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Detach the queue handler and stop the listener, writing pending records.
+
+    Suppressed counts that were never reported are written as summaries first.
+    """
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logger.removeHandler(_queue_handler)
+        if isinstance(_queue_handler, _DeferredQueueHandler):
+            _queue_handler.emit_suppressed(force=True)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def log_and_raise(exc: Exception, level: str = "error") -> None:
     """Log an exception and re-raise it as DemoError if needed."""
-    msg = f"{exc.__class__.__name__}: {exc}"
-    if level == "warning":
-        logger.warning(msg)
-    else:
-        logger.error(msg)
+    log = logger.warning if level == "warning" else logger.error
+    log("%s: %s", exc.__class__.__name__, exc, extra={"dedup_key": (exc.__class__, str(exc))})
     raise exc
@@ -7,6 +7,7 @@ Provides:
 from __future__ import annotations
 
 import asyncio
+import weakref
 from typing import Callable, Any, Awaitable, Dict, List, Optional
 from functools import partial
 
@@ -21,8 +22,12 @@ class EventBroker:
     async handlers and call sync handlers in the event loop's default executor.
     """
 
+    # live brokers, for memory accounting (see memory.py)
+    _instances: "weakref.WeakSet[EventBroker]" = weakref.WeakSet()
+
     def __init__(self) -> None:
         self._subscribers: Dict[str, List[Handler]] = {}
+        EventBroker._instances.add(self)
 
     def subscribe(self, event: str, handler: Handler) -> None:
         self._subscribers.setdefault(event, []).append(handler)
@@ -58,8 +63,12 @@ class Scheduler:
     It supports starting and stopping tasks and scheduling one-off delayed calls.
     """
 
+    # live schedulers, for memory accounting (see memory.py)
+    _instances: "weakref.WeakSet[Scheduler]" = weakref.WeakSet()
+
     def __init__(self) -> None:
         self._tasks: List[asyncio.Task] = []
+        Scheduler._instances.add(self)
 
     def schedule_periodic(self, coro_func: AsyncHandler, interval: float) -> asyncio.Task:
         async def runner():
@@ -1,8 +1,17 @@
-"""Protocols, ABCs and Generic examples for pedagogical purposes."""
+"""Protocols, ABCs and Generic examples for pedagogical purposes.
+
+``Service.process_many`` is the batch contract: the default loops over
+``process``, subclasses override it when a batch can be handled faster. The
+service executors split a large input into chunks and run ``process_many`` on
+each chunk in a thread or process pool, preserving input order.
+"""
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Protocol, runtime_checkable, Generic, TypeVar
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Protocol, runtime_checkable, Generic, TypeVar
 
 T = TypeVar("T")
 
@@ -14,6 +23,22 @@ class Service(ABC, Generic[T]):
     def process(self, item: T) -> T:
         ...
 
+    def process_many(self, items: Iterable[T]) -> List[T]:
+        """Process a batch of items; override when a batch can be done faster."""
+        process = self.process
+        return [process(item) for item in items]
+
+    async def aprocess_many(self, items: Iterable[T], executor: Optional["ServiceExecutor[T]"] = None) -> List[T]:
+        """``process_many`` off the event loop, in ``executor`` or a worker thread.
+
+        ``executor`` must have been created for this service.
+        """
+        if executor is not None:
+            if executor.service is not self:
+                raise ValueError("executor was created for a different service")
+            return await executor.amap(items)
+        return await asyncio.to_thread(self.process_many, list(items))
+
 
 @runtime_checkable
 class Serializable(Protocol):
@@ -22,4 +47,84 @@ class Serializable(Protocol):
 
 class UpperService(Service[str]):
     def process(self, item: str) -> str:
-        return item.upper()
\ No newline at end of file
+        return item.upper()
+
+    def process_many(self, items: Iterable[str]) -> List[str]:
+        return list(map(str.upper, items))
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _process_chunk(service: Service[T], chunk: List[T]) -> List[T]:
+    # module-level so process pools can pickle it
+    return service.process_many(chunk)
+
+
+class ServiceExecutor(ABC, Generic[T]):
+    """Run a service's ``process_many`` over chunks of the input in a pool.
+
+    Subclasses only choose the pool; use as a context manager (or call
+    :meth:`shutdown`) to release it.
+    """
+
+    def __init__(self, service: Service[T], *, max_workers: Optional[int] = None, chunk_size: int = 1024) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.service = service
+        self.chunk_size = chunk_size
+        self._pool = self._make_pool(max_workers)
+
+    @abstractmethod
+    def _make_pool(self, max_workers: Optional[int]) -> Executor:
+        ...
+
+    def map(self, items: Iterable[T]) -> List[T]:
+        futures = [self._pool.submit(_process_chunk, self.service, chunk) for chunk in _chunks(items, self.chunk_size)]
+        out: List[T] = []
+        for f in futures:
+            out.extend(f.result())
+        return out
+
+    async def amap(self, items: Iterable[T]) -> List[T]:
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(self._pool, _process_chunk, self.service, chunk)
+            for chunk in _chunks(items, self.chunk_size)
+        ]
+        out: List[T] = []
+        for chunk in await asyncio.gather(*futures):
+            out.extend(chunk)
+        return out
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ServiceExecutor[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
+
+
+class ThreadPoolServiceExecutor(ServiceExecutor[T]):
+    """Chunks run in threads: best when ``process`` releases the GIL or does I/O."""
+
+    def _make_pool(self, max_workers: Optional[int]) -> Executor:
+        return ThreadPoolExecutor(max_workers, thread_name_prefix="service")
+
+
+class ProcessPoolServiceExecutor(ServiceExecutor[T]):
+    """Chunks run in worker processes: for CPU-bound services.
+
+    The service and the items must be picklable; each chunk is sent with a
+    copy of the service, so keep services small and larger chunks amortise it.
+    """
+
+    def _make_pool(self, max_workers: Optional[int]) -> Executor:
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers)
@@ -1,16 +1,74 @@
 """Introspection utilities using inspect and typing to dynamically build functions.
 
 Demonstrates: inspect.signature, annotations, closures, partials and dynamic factory.
+
+Signatures are cached per function (weakly, so the cache never keeps a
+function alive), and :func:`compile_binder` / :func:`compile_adapter` generate
+per-callable Python code that does argument mapping through a plain call
+instead of ``Signature.bind``.
 """
 from __future__ import annotations
 
 import inspect
+import keyword
+import linecache
+import math
+import weakref
 from functools import partial
-from typing import Callable, Any
+from typing import Callable, Any, Dict, List, Mapping
+
+_SIGNATURES: "weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature]" = weakref.WeakKeyDictionary()
+# underlying function -> signature of its bound methods (first parameter dropped)
+_BOUND_SIGNATURES: "weakref.WeakKeyDictionary[Callable[..., Any], inspect.Signature]" = weakref.WeakKeyDictionary()
+_BINDERS: "weakref.WeakKeyDictionary[Callable[..., Any], Callable[..., Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+_ADAPTERS: "weakref.WeakKeyDictionary[Callable[..., Any], Callable[[Mapping[str, Any]], Any]]" = weakref.WeakKeyDictionary()
+# bound methods are created afresh on every attribute access, so their
+# binders/adapters are cached on the underlying function instead
+_METHOD_BINDERS: "weakref.WeakKeyDictionary[Callable[..., Any], Callable[..., Dict[str, Any]]]" = weakref.WeakKeyDictionary()
+_METHOD_ADAPTERS: "weakref.WeakKeyDictionary[Callable[..., Any], Callable[..., Any]]" = weakref.WeakKeyDictionary()
+
+_P = inspect.Parameter
+
+
+def cached_signature(func: Callable[..., Any]) -> inspect.Signature:
+    """``inspect.signature`` with a per-function cache.
+
+    Bound methods are cached through their underlying function (they are
+    created afresh on every attribute access). Callables that cannot be
+    weakly referenced are not cached.
+    """
+    target = getattr(func, "__func__", None)
+    if target is not None and getattr(func, "__self__", None) is not None:
+        return _bound_signature(target)
+    try:
+        return _SIGNATURES[func]
+    except KeyError:
+        sig = _SIGNATURES[func] = inspect.signature(func)
+        return sig
+    except TypeError:
+        return inspect.signature(func)
+
+
+def _bound_signature(target: Callable[..., Any]) -> inspect.Signature:
+    """Signature of ``target`` as seen through a bound method, cached per ``target``."""
+    try:
+        return _BOUND_SIGNATURES[target]
+    except (KeyError, TypeError):
+        pass
+    sig = cached_signature(target)
+    params = list(sig.parameters.values())
+    # ``self`` only binds to a leading positional parameter; ``def m(*args)`` keeps ``*args``
+    if params and params[0].kind in (_P.POSITIONAL_ONLY, _P.POSITIONAL_OR_KEYWORD):
+        sig = sig.replace(parameters=params[1:])
+    try:
+        _BOUND_SIGNATURES[target] = sig
+    except TypeError:
+        pass
+    return sig
 
 
 def summarize_callable(func: Callable[..., Any]) -> dict:
-    sig = inspect.signature(func)
+    sig = cached_signature(func)
     return {
         "name": getattr(func, "__name__", repr(func)),
         "params": [p.name for p in sig.parameters.values()],
@@ -18,6 +76,112 @@ def summarize_callable(func: Callable[..., Any]) -> dict:
     }
 
 
+def _compile(source: str, filename: str, namespace: Dict[str, Any], name: str) -> Callable[..., Any]:
+    code = compile(source, filename, "exec")
+    # register the source so tracebacks through generated code show it
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(code, namespace)
+    return namespace[name]
+
+
+def _param_list(sig: inspect.Signature, ns: Dict[str, Any]) -> List[str]:
+    """Render ``sig`` as a def parameter list; defaults are looked up in ``ns``."""
+    out: List[str] = []
+    kinds = [p.kind for p in sig.parameters.values()]
+    for i, p in enumerate(sig.parameters.values()):
+        if p.kind is _P.KEYWORD_ONLY and _P.VAR_POSITIONAL not in kinds[:i] and "*" not in out:
+            out.append("*")
+        text = p.name
+        if p.kind is _P.VAR_POSITIONAL:
+            text = "*" + p.name
+        elif p.kind is _P.VAR_KEYWORD:
+            text = "**" + p.name
+        elif p.default is not _P.empty:
+            ns[f"_default_{p.name}"] = p.default
+            text = f"{p.name}=_default_{p.name}"
+        out.append(text)
+        if p.kind is _P.POSITIONAL_ONLY and (i + 1 == len(kinds) or kinds[i + 1] is not _P.POSITIONAL_ONLY):
+            out.append("/")
+    return out
+
+
+def _cached_compile(cache: "weakref.WeakKeyDictionary", func: Callable[..., Any], build: Callable[..., Any]) -> Any:
+    # generated code never references ``func`` (callers pass it in when
+    # needed), so caching it does not keep its weak key alive
+    try:
+        return cache[func]
+    except KeyError:
+        compiled = cache[func] = build(func)
+        return compiled
+    except TypeError:
+        return build(func)
+
+
+def _build_binder(func: Callable[..., Any], *, bound: bool = False) -> Callable[..., Dict[str, Any]]:
+    sig = _bound_signature(func) if bound else cached_signature(func)
+    ns: Dict[str, Any] = {}
+    params = _param_list(sig, ns)
+    body = ", ".join(f"{p!r}: {p}" for p in sig.parameters)
+    name = getattr(func, "__name__", "callable")
+    source = f"def _bind({', '.join(params)}):\n    return {{{body}}}\n"
+    return _compile(source, f"<binder {name}>", ns, "_bind")
+
+
+def compile_binder(func: Callable[..., Any]) -> Callable[..., Dict[str, Any]]:
+    """Return a function mapping ``(*args, **kwargs)`` to ``func``'s arguments.
+
+    The result matches ``sig.bind(*args, **kwargs)`` followed by
+    ``apply_defaults()`` (and raises ``TypeError`` the same way), but the
+    mapping is done by the interpreter's own call machinery.
+    """
+    if inspect.ismethod(func):
+        return _cached_compile(_METHOD_BINDERS, func.__func__, partial(_build_binder, bound=True))
+    return _cached_compile(_BINDERS, func, _build_binder)
+
+
+def _build_adapter(func: Callable[..., Any], *, bound: bool = False) -> Callable[..., Any]:
+    # the target is an argument, ``_adapter(_target, values)``, so the cached
+    # code can be shared; with ``bound`` it is ``_adapter(_target, _self, values)``
+    sig = _bound_signature(func) if bound else cached_signature(func)
+    ns: Dict[str, Any] = {}
+    positional: List[str] = []
+    keywords: List[str] = []
+    for p in sig.parameters.values():
+        if p.kind in (_P.VAR_POSITIONAL, _P.VAR_KEYWORD):
+            continue
+        if p.default is _P.empty:
+            value = f"_values[{p.name!r}]"
+        else:
+            ns[f"_default_{p.name}"] = p.default
+            value = f"_values.get({p.name!r}, _default_{p.name})"
+        if p.kind is _P.KEYWORD_ONLY:
+            keywords.append(f"{p.name}={value}")
+        else:
+            positional.append(value)
+    name = getattr(func, "__name__", "callable")
+    if bound:
+        positional.insert(0, "_self")
+    source = (
+        f"def _adapter(_target, {'_self, ' if bound else ''}_values):\n"
+        f"    return _target({', '.join(positional + keywords)})\n"
+    )
+    return _compile(source, f"<adapter {name}>", ns, "_adapter")
+
+
+def compile_adapter(func: Callable[..., Any]) -> Callable[[Mapping[str, Any]], Any]:
+    """Return ``adapter(values)`` calling ``func`` with its named parameters from ``values``.
+
+    Keys that ``func`` does not accept are ignored, missing optional
+    parameters take their defaults and a missing required one raises
+    ``KeyError``. ``*args``/``**kwargs`` parameters are not filled. The
+    adapter holds a reference to ``func``, so it stays usable on its own.
+    """
+    if inspect.ismethod(func):
+        adapter = _cached_compile(_METHOD_ADAPTERS, func.__func__, partial(_build_adapter, bound=True))
+        return partial(adapter, func.__func__, func.__self__)
+    return partial(_cached_compile(_ADAPTERS, func, _build_adapter), func)
+
+
 def make_adder(x: int) -> Callable[[int], int]:
     """Dynamically create and return a closure that adds x."""
     def add(y: int) -> int:
@@ -26,10 +190,24 @@ def make_adder(x: int) -> Callable[[int], int]:
     return add
 
 
-def factory_from_spec(name: str, *, multiplier: int = 1) -> Callable[[int], int]:
-    """Return a function built dynamically with partials and closures."""
-    def base(a: int) -> int:
-        return a * multiplier
+def factory_from_spec(name: str, *, multiplier: int = 1, compiled: bool = False) -> Callable[[int], int]:
+    """Return a function built dynamically with partials and closures.
+
+    With ``compiled=True`` the function is generated from source instead, so
+    ``multiplier`` is a constant in its bytecode rather than a closure cell.
+    """
+    if not compiled:
+        def base(a: int) -> int:
+            return a * multiplier
 
-    base.__name__ = name
-    return base
+        base.__name__ = name
+        return base
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"not a valid function name: {name!r}")
+    # only types whose repr is a literal that evaluates back to the same value
+    if not isinstance(multiplier, (int, float)):
+        raise TypeError(f"compiled multiplier must be an int or float, not {type(multiplier).__name__}")
+    if not math.isfinite(multiplier):
+        raise ValueError(f"compiled multiplier must be finite, not {multiplier!r}")
+    source = f"def {name}(a: int) -> int:\n    return a * {multiplier!r}\n"
+    return _compile(source, f"<factory {name}>", {}, name)
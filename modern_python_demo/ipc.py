@@ -0,0 +1,467 @@
+"""Local IPC front-end for :class:`EventBroker` over a Unix domain socket.
+
+:class:`IPCServer` exposes a broker's ``emit``/``subscribe`` to other
+processes on the same machine; :class:`IPCClient` talks to it and
+:class:`IPCClientPool` keeps a few connected clients around for reuse.
+
+Wire format: each frame is a 4-byte big-endian length followed by one
+message batch encoded with the package's serialization helpers (versioned
+JSON by default, pickle on request; only use pickle between processes you
+trust). Both sides coalesce everything queued during one event-loop turn into
+a single frame. Clients pipeline: ``emit`` returns as soon as the message is
+queued, up to ``window`` unacknowledged messages per connection, and the ack
+arrives later as the result of the returned future.
+
+Run ``python -m modern_python_demo.ipc`` to measure latency and throughput
+against an in-process server.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import os
+import stat
+import struct
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from .errors import IPCError, SerializationError, logger
+from .events import EventBroker
+from .serialization import dumps_json, dumps_pickle, loads_json, loads_pickle
+
+_HEADER = struct.Struct("!I")
+MAX_FRAME = 16 * 1024 * 1024
+
+
+def _encode(batch: List[Dict[str, Any]], codec: str) -> bytes:
+    if codec == "json":
+        return dumps_json(batch).encode("utf8")
+    if codec == "pickle":
+        return dumps_pickle(batch)
+    raise SerializationError(f"unknown codec {codec!r}")
+
+
+def _decode(body: bytes, codec: str) -> List[Dict[str, Any]]:
+    if codec == "json":
+        return loads_json(body.decode("utf8"))["data"]
+    if codec == "pickle":
+        return loads_pickle(body)["data"]
+    raise SerializationError(f"unknown codec {codec!r}")
+
+
+async def _read_frame(reader: asyncio.StreamReader, codec: str) -> List[Dict[str, Any]]:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if size > MAX_FRAME:
+        raise IPCError(f"frame of {size} bytes exceeds limit of {MAX_FRAME}")
+    body = await reader.readexactly(size)
+    try:
+        batch = _decode(body, codec)
+    except SerializationError:
+        raise
+    except Exception as e:
+        # a corrupt or hostile frame can fail in many ways (bad UTF-8, JSON, pickle, envelope)
+        raise IPCError(f"undecodable frame: {e.__class__.__name__}: {e}") from e
+    if not isinstance(batch, list) or not all(isinstance(msg, dict) for msg in batch):
+        raise IPCError("malformed frame: expected a list of message objects")
+    return batch
+
+
+class _FrameWriter:
+    """Collects outgoing messages and writes everything queued in one loop turn as one frame."""
+
+    def __init__(self, writer: asyncio.StreamWriter, codec: str, max_batch: int) -> None:
+        self._writer = writer
+        self._codec = codec
+        self._max_batch = max_batch
+        self._outbox: List[Dict[str, Any]] = []
+        self._scheduled = False
+
+    def send(self, msg: Dict[str, Any]) -> None:
+        self._outbox.append(msg)
+        if len(self._outbox) >= self._max_batch:
+            self.flush()
+        elif not self._scheduled:
+            self._scheduled = True
+            asyncio.get_running_loop().call_soon(self.flush)
+
+    def flush(self) -> None:
+        self._scheduled = False
+        if not self._outbox or self._writer.is_closing():
+            self._outbox.clear()
+            return
+        body = _encode(self._outbox, self._codec)
+        self._outbox = []
+        self._writer.write(_HEADER.pack(len(body)) + body)
+
+    async def drain(self) -> None:
+        self.flush()
+        await self._writer.drain()
+
+
+class IPCServer:
+    """Serve ``broker`` on the Unix socket at ``path``.
+
+    Messages from one connection are applied in order; each ``emit`` is
+    acknowledged once the broker has run all its handlers.
+    """
+
+    def __init__(self, broker: EventBroker, path: str, *, codec: str = "json", max_batch: int = 256) -> None:
+        self.broker = broker
+        self.path = path
+        self.codec = codec
+        self.max_batch = max_batch
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set["asyncio.Task[None]"] = set()
+
+    async def start(self) -> "IPCServer":
+        await self._remove_stale_socket()
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+        return self
+
+    async def _remove_stale_socket(self) -> None:
+        """Unlink a socket left behind by a dead server; refuse to touch anything else."""
+        try:
+            mode = os.stat(self.path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{self.path} exists and is not a socket")
+        try:
+            _, writer = await asyncio.open_unix_connection(self.path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.path)
+            return
+        writer.close()
+        raise FileExistsError(f"another server is already listening on {self.path}")
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def __aenter__(self) -> "IPCServer":
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        out = _FrameWriter(writer, self.codec, self.max_batch)
+        forwarders: List[Tuple[str, Callable[..., Any]]] = []
+        try:
+            while True:
+                try:
+                    batch = await _read_frame(reader, self.codec)
+                except asyncio.IncompleteReadError:
+                    return
+                for msg in batch:
+                    await self._apply(msg, out, forwarders)
+                await out.drain()
+        except (ConnectionError, IPCError, SerializationError, asyncio.CancelledError):
+            # peer went away, sent an oversized, undecodable or malformed frame, or we are closing
+            pass
+        finally:
+            for event, handler in forwarders:
+                self.broker.unsubscribe(event, handler)
+            self._connections.discard(task)
+            writer.close()
+
+    async def _apply(self, msg: Dict[str, Any], out: _FrameWriter, forwarders: List[Tuple[str, Callable[..., Any]]]) -> None:
+        op = msg.get("op")
+        error: Optional[str] = None
+        try:
+            if op == "emit":
+                await self.broker.emit(msg["event"], *msg.get("args", ()), **msg.get("kwargs", {}))
+            elif op == "subscribe":
+                event = msg["event"]
+
+                async def forward(event: str, *args: Any, **kwargs: Any) -> None:
+                    out.send({"op": "event", "event": event, "args": list(args), "kwargs": kwargs})
+
+                self.broker.subscribe(event, forward)
+                forwarders.append((event, forward))
+            else:
+                error = f"unknown op {op!r}"
+        except Exception as e:
+            error = f"{e.__class__.__name__}: {e}"
+        out.send({"op": "ack", "id": msg.get("id"), "ok": error is None, "error": error})
+
+
+class IPCClient:
+    """One connection to an :class:`IPCServer`; safe to share between tasks.
+
+    Pushed events are handed to subscriber handlers from a separate task, in
+    arrival order, so a slow or failing handler never stalls acknowledgements
+    and a handler may itself ``publish`` on the same client. Handler
+    exceptions are logged and otherwise ignored.
+    """
+
+    def __init__(
+        self, path: str, *, codec: str = "json", window: int = 1024, max_batch: int = 256
+    ) -> None:
+        self.path = path
+        self.codec = codec
+        self.max_batch = max_batch
+        self._window = asyncio.Semaphore(window)
+        self._lost: Optional[BaseException] = None
+        self._ids = itertools.count()
+        self._pending: Dict[int, "asyncio.Future[None]"] = {}
+        self._handlers: Dict[str, List[Callable[..., Any]]] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._out: Optional[_FrameWriter] = None
+        self._reader_task: Optional["asyncio.Task[None]"] = None
+        self._dispatch_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing() and self._lost is None
+
+    async def connect(self) -> "IPCClient":
+        if self._writer is not None:
+            self._writer.close()  # reconnecting: drop the old connection
+        reader, self._writer = await asyncio.open_unix_connection(self.path)
+        self._lost = None
+        self._out = _FrameWriter(self._writer, self.codec, self.max_batch)
+        events: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue()
+        self._reader_task = asyncio.create_task(self._read_loop(reader, events))
+        self._dispatch_task = asyncio.create_task(self._dispatch_loop(events))
+        # the server forgets a connection's subscriptions when it drops; restore them
+        acks = [await self._send({"op": "subscribe", "event": event}) for event in self._handlers]
+        await asyncio.gather(*acks)
+        return self
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._out.flush()  # type: ignore[union-attr]
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        tasks = [t for t in (self._reader_task, self._dispatch_task) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._fail_pending(ConnectionError("IPC connection closed"))
+
+    async def __aenter__(self) -> "IPCClient":
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def _send(self, msg: Dict[str, Any]) -> "asyncio.Future[None]":
+        if self._out is None:
+            raise ConnectionError("IPC client is not connected")
+        await self._window.acquire()
+        if self._lost is not None:
+            # the connection dropped while we waited for a free slot
+            self._window.release()
+            raise ConnectionError(f"IPC connection lost: {self._lost}")
+        msg["id"] = next(self._ids)
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._pending[msg["id"]] = fut
+        self._out.send(msg)
+        return fut
+
+    async def emit(self, event: str, *args: Any, **kwargs: Any) -> "asyncio.Future[None]":
+        """Queue an emit and return a future resolved when the server acknowledges it.
+
+        Waits only if ``window`` messages are already unacknowledged.
+        """
+        return await self._send({"op": "emit", "event": event, "args": list(args), "kwargs": kwargs})
+
+    async def publish(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """Emit and wait for the acknowledgement."""
+        await (await self.emit(event, *args, **kwargs))
+
+    async def subscribe(self, event: str, handler: Callable[..., Any]) -> None:
+        """Call ``handler(event, *args, **kwargs)`` (sync or async) for events the server pushes.
+
+        Subscriptions are re-sent to the server whenever the client reconnects.
+        """
+        handlers = self._handlers.setdefault(event, [])
+        first = not handlers
+        handlers.append(handler)
+        if not first:
+            return
+        try:
+            await (await self._send({"op": "subscribe", "event": event}))
+        except BaseException:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event]
+            raise
+
+    async def flush(self) -> None:
+        """Wait until every message sent so far has been acknowledged."""
+        if self._out is not None:
+            await self._out.drain()
+        if self._pending:
+            await asyncio.gather(*list(self._pending.values()), return_exceptions=True)
+
+    async def _read_loop(self, reader: asyncio.StreamReader, events: "asyncio.Queue[Optional[Dict[str, Any]]]") -> None:
+        error: BaseException = ConnectionError("IPC connection closed")
+        try:
+            while True:
+                for msg in await _read_frame(reader, self.codec):
+                    if msg.get("op") == "ack":
+                        self._ack(msg)
+                    elif msg.get("op") == "event":
+                        events.put_nowait(msg)
+        except (asyncio.IncompleteReadError, ConnectionError, IPCError, SerializationError, ValueError) as e:
+            error = ConnectionError(f"IPC connection lost: {e}")
+        finally:
+            self._lost = error
+            events.put_nowait(None)
+            self._fail_pending(error)
+
+    def _ack(self, msg: Dict[str, Any]) -> None:
+        fut = self._pending.pop(msg["id"], None)
+        if fut is None:
+            return  # already failed (and its permit released) or not ours
+        self._window.release()
+        if fut.done():
+            return
+        if msg.get("ok"):
+            fut.set_result(None)
+        else:
+            fut.set_exception(IPCError(msg.get("error") or "remote error"))
+
+    async def _dispatch_loop(self, events: "asyncio.Queue[Optional[Dict[str, Any]]]") -> None:
+        while (msg := await events.get()) is not None:
+            event = msg["event"]
+            for handler in list(self._handlers.get(event, ())):
+                try:
+                    result = handler(event, *msg.get("args", ()), **msg.get("kwargs", {}))
+                    if asyncio.iscoroutine(result):
+                        await result
+                except Exception:
+                    logger.exception("IPC subscriber %r failed on %r", handler, event)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        pending, self._pending = self._pending, {}
+        for fut in pending.values():
+            # every pending message holds a window slot
+            self._window.release()
+            if not fut.done():
+                fut.set_exception(exc)
+            if not fut.cancelled():
+                # retrieve it so an unawaited pipelined future does not log a warning
+                fut.exception()
+
+
+class IPCClientPool:
+    """Up to ``size`` connected clients, handed out one caller at a time and reused."""
+
+    def __init__(self, path: str, *, size: int = 4, **client_kwargs: Any) -> None:
+        self.path = path
+        self.size = size
+        self._client_kwargs = client_kwargs
+        self._idle: "asyncio.Queue[IPCClient]" = asyncio.Queue()
+        self._all: List[IPCClient] = []
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[IPCClient]:
+        if self._idle.empty() and len(self._all) < self.size:
+            client = IPCClient(self.path, **self._client_kwargs)
+            self._all.append(client)
+            try:
+                await client.connect()
+            except Exception:
+                self._all.remove(client)
+                raise
+        else:
+            client = await self._idle.get()
+            if not client.connected:
+                await client.connect()
+        try:
+            yield client
+        finally:
+            self._idle.put_nowait(client)
+
+    async def publish(self, event: str, *args: Any, **kwargs: Any) -> None:
+        async with self.acquire() as client:
+            await client.publish(event, *args, **kwargs)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(c.close() for c in self._all), return_exceptions=True)
+        self._all.clear()
+        self._idle = asyncio.Queue()
+
+    async def __aenter__(self) -> "IPCClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+async def measure_ipc(
+    messages: int = 10_000, *, codec: str = "json", window: int = 256, payload_size: int = 8
+) -> Dict[str, float]:
+    """Publish ``messages`` pipelined emits to an in-process server and time the acks."""
+    from .benchmark import percentile
+
+    broker = EventBroker()
+    received = 0
+
+    async def sink(event: str, payload: Any) -> None:
+        nonlocal received
+        received += 1
+
+    broker.subscribe("bench", sink)
+    payload = {f"k{i}": i for i in range(payload_size)}
+    latencies: List[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "broker.sock")
+        async with IPCServer(broker, path, codec=codec), IPCClient(path, codec=codec, window=window) as client:
+            start = time.perf_counter()
+            futures = []
+            for _ in range(messages):
+                sent = time.perf_counter()
+                fut = await client.emit("bench", payload)
+                fut.add_done_callback(lambda _f, sent=sent: latencies.append(time.perf_counter() - sent))
+                futures.append(fut)
+            await asyncio.gather(*futures)
+            elapsed = time.perf_counter() - start
+    return {
+        "messages": float(received),
+        "seconds": elapsed,
+        "msgs_per_sec": messages / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 0.5) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Measure EventBroker IPC latency and throughput locally.")
+    p.add_argument("--messages", type=int, default=10_000)
+    p.add_argument("--codec", choices=("json", "pickle"), default="json")
+    p.add_argument("--window", type=int, default=256, help="max unacknowledged messages")
+    p.add_argument("--payload-size", type=int, default=8, help="keys in each payload dict")
+    args = p.parse_args(argv)
+    stats = asyncio.run(
+        measure_ipc(args.messages, codec=args.codec, window=args.window, payload_size=args.payload_size)
+    )
+    print(
+        f"{int(stats['messages'])} messages in {stats['seconds']:.3f}s: {stats['msgs_per_sec']:.0f} msg/s, "
+        f"ack latency p50 {stats['p50_ms']:.3f} ms, p99 {stats['p99_ms']:.3f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
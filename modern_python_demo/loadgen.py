@@ -0,0 +1,176 @@
+"""Load generator driving ``DemoTask.run`` through an ``EventBroker``.
+
+Used by ``python -m modern_python_demo load``: ``concurrency`` workers run
+tasks back to back (optionally paced to ``rate`` tasks/s overall) for
+``duration`` seconds against a broker with a configurable mix of sync, async
+and slow handlers, then report throughput, emit latency, event-loop lag and
+peak memory.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .benchmark import percentile
+from .events import EventBroker
+
+DEFAULT_MIX = {"sync": 1, "async": 1, "slow": 0}
+
+
+def parse_mix(spec: str) -> Dict[str, int]:
+    """Parse ``"sync=2,async=1,slow=1"`` into handler counts per kind."""
+    mix = dict.fromkeys(DEFAULT_MIX, 0)
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        kind, _, count = part.partition("=")
+        if kind not in mix:
+            raise ValueError(f"unknown handler kind {kind!r} (expected one of {', '.join(mix)})")
+        mix[kind] = int(count or 1)
+    return mix
+
+
+class _TimedBroker(EventBroker):
+    """EventBroker recording how long each ``emit`` takes."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.latencies: List[float] = []
+
+    async def emit(self, event: str, *args, **kwargs) -> None:
+        start = time.perf_counter()
+        await super().emit(event, *args, **kwargs)
+        self.latencies.append(time.perf_counter() - start)
+
+
+@dataclass
+class LoadReport:
+    duration: float
+    tasks: int
+    errors: int
+    events: int
+    emit_p50: float
+    emit_p99: float
+    lag_p99: float
+    lag_max: float
+    peak_memory_kb: Optional[int]
+    mix: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.tasks / self.duration if self.duration else 0.0
+
+    def format(self) -> str:
+        mem = f"{self.peak_memory_kb} KiB" if self.peak_memory_kb is not None else "n/a"
+        mix = ", ".join(f"{k}={v}" for k, v in self.mix.items())
+        return "\n".join(
+            [
+                f"handlers:        {mix}",
+                f"tasks:           {self.tasks} in {self.duration:.2f}s ({self.throughput:.1f}/s), {self.errors} errors",
+                f"events emitted:  {self.events}",
+                f"emit latency:    p50 {self.emit_p50 * 1e3:.2f} ms, p99 {self.emit_p99 * 1e3:.2f} ms",
+                f"event-loop lag:  p99 {self.lag_p99 * 1e3:.2f} ms, max {self.lag_max * 1e3:.2f} ms",
+                f"peak memory:     {mem}",
+            ]
+        )
+
+
+def _peak_memory_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _subscribe_mix(broker: EventBroker, mix: Dict[str, int], slow_delay: float) -> None:
+    def sync_handler(event: str, payload: Any) -> None:
+        return None
+
+    async def async_handler(event: str, payload: Any) -> None:
+        return None
+
+    async def slow_handler(event: str, payload: Any) -> None:
+        await asyncio.sleep(slow_delay)
+
+    handlers = {"sync": sync_handler, "async": async_handler, "slow": slow_handler}
+    for event in ("task.started", "task.finished"):
+        for kind, count in mix.items():
+            for _ in range(count):
+                broker.subscribe(event, handlers[kind])
+
+
+async def _monitor_lag(samples: List[float], interval: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected))
+
+
+async def run_load(
+    *,
+    concurrency: int = 10,
+    rate: float = 0.0,
+    duration: float = 5.0,
+    mix: Optional[Dict[str, int]] = None,
+    slow_delay: float = 0.05,
+    lag_interval: float = 0.01,
+) -> LoadReport:
+    """Run the load test and return its report. ``rate <= 0`` means unpaced."""
+    from .main import DemoTask
+
+    mix = dict(DEFAULT_MIX if mix is None else mix)
+    broker = _TimedBroker()
+    _subscribe_mix(broker, mix, slow_delay)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + duration
+    interval = 1.0 / rate if rate > 0 else 0.0
+    next_slot = start
+    counts = {"tasks": 0, "errors": 0}
+    lag: List[float] = []
+    stop = asyncio.Event()
+
+    async def worker(wid: int) -> None:
+        nonlocal next_slot
+        n = 0
+        while True:
+            if interval:
+                # claim the next slot of the global schedule, then wait for it
+                slot, next_slot = next_slot, max(next_slot, loop.time()) + interval
+                if slot >= deadline:
+                    return
+                if slot > loop.time():
+                    await asyncio.sleep(slot - loop.time())
+            elif loop.time() >= deadline:
+                return
+            try:
+                await DemoTask(f"load-{wid}-{n}").run(broker)
+                counts["tasks"] += 1
+            except Exception:
+                counts["errors"] += 1
+            n += 1
+
+    monitor = asyncio.create_task(_monitor_lag(lag, lag_interval, stop))
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = loop.time() - start
+    stop.set()
+    await monitor
+
+    return LoadReport(
+        duration=elapsed,
+        tasks=counts["tasks"],
+        errors=counts["errors"],
+        events=len(broker.latencies),
+        emit_p50=percentile(broker.latencies, 0.5),
+        emit_p99=percentile(broker.latencies, 0.99),
+        lag_p99=percentile(lag, 0.99),
+        lag_max=max(lag, default=0.0),
+        peak_memory_kb=_peak_memory_kb(),
+        mix=mix,
+    )
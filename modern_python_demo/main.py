@@ -11,14 +11,8 @@ from typing import Any
 from .config import Config, temp_config
 from .decorators import timed, memoize_with_limit, with_metadata
 from .metaclasses import RegisteredBase, RegistryMeta
-from .models import Stats, AttrsPoint, Account
 from .events import EventBroker, Scheduler
-from .plugin_loader import discover_plugins
-from .serialization import dumps_json, loads_json, dumps_pickle, loads_pickle
-from .cache import fib, perf
-from .introspect import summarize_callable, make_adder, factory_from_spec
-from .pipelines import filter_even, multiply, compose
-from .errors import logger
+from .errors import configure_logging, logger
 
 
 @with_metadata(author="demo", created=time.time())
@@ -35,6 +29,16 @@ class DemoTask(RegisteredBase):
 
 
 async def main() -> None:
+    # Imported on first use rather than at module level: importing this module
+    # (e.g. for DemoTask) should not pay for attrs, YAML or plugin scanning.
+    from .models import Stats, AttrsPoint, Account
+    from .plugin_loader import discover_plugins
+    from .plugin_dispatch import PluginDispatcher
+    from .serialization import dumps_json, loads_json, dumps_pickle, loads_pickle
+    from .cache import fib
+    from .introspect import summarize_callable, make_adder, factory_from_spec
+    from .pipelines import filter_even, multiply, compose
+
     cfg = Config()
     logger.info(f"Starting demo (debug={cfg.debug})")
 
@@ -61,11 +65,10 @@ async def main() -> None:
     # Plugins
     plugins = discover_plugins()
     print("Discovered plugins:", [p.name for p in plugins if hasattr(p, 'name')])
-    for p in plugins:
-        try:
-            p.on_event("init", {"cfg": vars(cfg)})
-        except Exception as e:
-            print("Plugin error:", e)
+    dispatcher = PluginDispatcher(plugins)
+    for result in await dispatcher.dispatch("init", {"cfg": vars(cfg)}):
+        if result.error is not None:
+            print("Plugin error:", result.error)
 
     # Models and caching
     stats = Stats()
@@ -120,7 +123,7 @@ async def main() -> None:
     print("pickle load:", loads_pickle(pkl))
 
     # metaclass registry
-    print("Registered classes:", RegistryMeta.get_registry())
+    print("Registered classes:", dict(RegistryMeta.get_registry()))
 
     # temporary config
     with temp_config(cfg, debug=True) as tcfg:
@@ -132,8 +135,10 @@ async def main() -> None:
 
     # cancel scheduler and finish
     scheduler.cancel_all()
+    dispatcher.close()
     print("Demo complete")
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(main())
@@ -0,0 +1,193 @@
+"""Opt-in memory accounting for the package's long-lived structures.
+
+The reports and tracemalloc helpers only run when called. The one always-on
+cost is bookkeeping that lets reporters find live objects:
+``memoize_with_limit`` wrappers, ``EventBroker`` and ``Scheduler`` instances
+add themselves to a module-level ``WeakSet`` when created (well under a
+microsecond per construction; none of these are created on hot paths).
+
+:func:`subsystem_reports` reports, for the
+``memoize_with_limit`` caches, the ``fib`` LRU cache, the ``RegistryMeta``
+registry, ``EventBroker`` subscriber lists and ``Scheduler`` task lists, how
+many objects each retains and their approximate deep size. The tracemalloc
+helpers take snapshots filtered to this package's source files and diff them,
+and :func:`memory_report` combines both into a ranked text report (also
+available as ``python -m modern_python_demo --memory-report``).
+"""
+from __future__ import annotations
+
+import gc
+import os
+import sys
+import tracemalloc
+import types
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def deep_sizeof(obj: Any, *, limit: int = 100_000) -> int:
+    """Approximate size in bytes of ``obj`` and everything reachable through containers.
+
+    Follows dicts, lists, tuples, sets and instance ``__dict__``s, counting
+    each object once. Modules, classes and functions are counted shallowly
+    (they are shared, not owned). Stops after ``limit`` objects.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack and len(seen) < limit:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o, 0)
+        if isinstance(o, (type, types.ModuleType, types.FunctionType)):
+            continue
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+        d = getattr(o, "__dict__", None)
+        if isinstance(d, dict):
+            stack.append(d)
+    return total
+
+
+@dataclass
+class SubsystemReport:
+    name: str
+    objects: int
+    deep_size: int
+    detail: str = ""
+
+
+def _memoize_report() -> SubsystemReport:
+    from .decorators import _memoized
+
+    caches = [w._cache for w in list(_memoized)]
+    entries = sum(len(c) for c in caches)
+    return SubsystemReport(
+        "decorators.memoize_with_limit", entries, sum(deep_sizeof(c) for c in caches), f"{len(caches)} caches"
+    )
+
+
+def _fib_report() -> SubsystemReport:
+    from .cache import fib
+
+    info = fib.cache_info()
+    # lru_cache does not expose its storage, but CPython's C implementation
+    # reports every cached key and result to the GC, so size the real ints
+    ints = [r for r in gc.get_referents(fib) if type(r) is int]
+    if len(ints) == 2 * info.currsize:
+        size = sum(map(sys.getsizeof, ints))
+        detail = f"maxsize={info.maxsize}; keys and results, excluding lru_cache entry overhead"
+    else:
+        # no access to the entries: assume fib's usual recursion filled keys 0..currsize-1
+        size = 0
+        a, b = 0, 1
+        for i in range(info.currsize):
+            size += sys.getsizeof(i) + sys.getsizeof(a)
+            a, b = b, a + b
+        detail = f"maxsize={info.maxsize}; estimated as fib(0..{max(info.currsize - 1, 0)})"
+    return SubsystemReport("cache.fib", info.currsize, size, detail)
+
+
+def _registry_report() -> SubsystemReport:
+    from .metaclasses import RegistryMeta
+
+    classes = list(RegistryMeta.get_registry().values())
+    indexed = sum(len(bucket) for idx in RegistryMeta._indexes.values() for bucket in idx.values())
+    size = sum(sys.getsizeof(c, 0) + deep_sizeof(dict(vars(c))) for c in classes)
+    return SubsystemReport("metaclasses.RegistryMeta", len(classes), size, f"{indexed} index entries")
+
+
+def _broker_report() -> SubsystemReport:
+    from .events import EventBroker
+
+    brokers = list(EventBroker._instances)
+    handlers = sum(len(h) for b in brokers for h in b._subscribers.values())
+    return SubsystemReport(
+        "events.EventBroker", handlers, sum(deep_sizeof(b._subscribers) for b in brokers), f"{len(brokers)} brokers"
+    )
+
+
+def _scheduler_report() -> SubsystemReport:
+    from .events import Scheduler
+
+    schedulers = list(Scheduler._instances)
+    tasks = [t for s in schedulers for t in s._tasks]
+    done = sum(t.done() for t in tasks)
+    return SubsystemReport(
+        "events.Scheduler",
+        len(tasks),
+        sum(deep_sizeof(s._tasks) for s in schedulers),
+        f"{len(schedulers)} schedulers, {done} finished tasks retained",
+    )
+
+
+# name -> reporter; other modules may register their own
+REPORTERS: Dict[str, Callable[[], SubsystemReport]] = {
+    "memoize": _memoize_report,
+    "fib": _fib_report,
+    "registry": _registry_report,
+    "broker": _broker_report,
+    "scheduler": _scheduler_report,
+}
+
+
+def subsystem_reports() -> List[SubsystemReport]:
+    """Run every reporter, largest deep size first."""
+    return sorted((r() for r in REPORTERS.values()), key=lambda r: r.deep_size, reverse=True)
+
+
+def start_tracing(frames: int = 1) -> None:
+    """Start tracemalloc (no-op if already tracing)."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+
+
+def stop_tracing() -> None:
+    tracemalloc.stop()
+
+
+def take_snapshot(package_only: bool = True) -> tracemalloc.Snapshot:
+    """Snapshot current allocations, by default keeping only this package's files."""
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc is not tracing; call start_tracing() first")
+    snap = tracemalloc.take_snapshot()
+    if package_only:
+        snap = snap.filter_traces([tracemalloc.Filter(True, os.path.join(PACKAGE_DIR, "*"))])
+    return snap
+
+
+def diff_snapshots(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, *, key_type: str = "lineno", limit: int = 10
+) -> List[tracemalloc.StatisticDiff]:
+    """Largest allocation changes between two snapshots."""
+    return after.compare_to(before, key_type)[:limit]
+
+
+def memory_report(*, limit: int = 10, baseline: Optional[tracemalloc.Snapshot] = None) -> str:
+    """Ranked report: subsystems by deep size, then top package allocation sites.
+
+    Allocation sites are only included while tracemalloc is tracing; with a
+    ``baseline`` snapshot they are shown as growth since that point.
+    """
+    lines = ["Subsystems (approximate deep size):"]
+    for r in subsystem_reports():
+        lines.append(f"  {r.deep_size / 1024:10.1f} KiB  {r.objects:8d} objects  {r.name}  ({r.detail})")
+    if tracemalloc.is_tracing():
+        snap = take_snapshot()
+        stats: Iterable[Any]
+        if baseline is not None:
+            lines.append(f"Allocation growth by line (top {limit}):")
+            stats = diff_snapshots(baseline, snap, limit=limit)
+        else:
+            lines.append(f"Allocations by line (top {limit}):")
+            stats = snap.statistics("lineno")[:limit]
+        for stat in stats:
+            lines.append(f"  {stat}")
+    return "\n".join(lines)
@@ -6,27 +6,141 @@ Includes:
 """
 from __future__ import annotations
 
-from typing import Dict, Type, Any
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Set, Type
 
 
 class RegistryMeta(type):
     """A metaclass that registers classes into a central registry.
 
     It shows how metaclasses can modify class creation and attach attributes.
+
+    The registry only holds weak references, so dynamically created classes
+    can still be garbage collected. Attributes named in ``_indexed_attrs``
+    (``version`` by default, more via :meth:`add_index`) are kept in secondary
+    indexes: ``find("version", "0.1")`` is a dict lookup instead of a scan.
+    Indexes track each class's value at registration time and any later
+    assignment or deletion (e.g. by ``with_metadata``), which is caught by the
+    metaclass ``__setattr__``/``__delattr__``; live subclasses that inherit
+    the attribute are re-indexed along with the class. ``generation()`` changes whenever the
+    registry or an index changes, so callers can cache query results.
     """
-    _registry: Dict[str, Type[Any]] = {}
+    _registry: "weakref.WeakValueDictionary[str, Type[Any]]" = weakref.WeakValueDictionary()
+    _indexed_attrs: Set[str] = {"version"}
+    _indexes: Dict[str, Dict[Any, "weakref.WeakSet[Type[Any]]"]] = {}
+    _generation: int = 0
 
     def __new__(mcls, name, bases, namespace, **kwargs):
         cls = super().__new__(mcls, name, bases, namespace)
         # attach a marker attribute
         setattr(cls, "_registered_by", mcls.__name__)
         if name != "RegisteredBase":
-            mcls._registry[f"{cls.__module__}.{name}"] = cls
+            key = f"{cls.__module__}.{name}"
+            replaced = RegistryMeta._registry.get(key)
+            if replaced is not None:
+                for attr in RegistryMeta._indexed_attrs:
+                    RegistryMeta._unindex(replaced, attr, getattr(replaced, attr, None))
+            RegistryMeta._registry[key] = cls
+            weakref.finalize(cls, RegistryMeta._bump)
+            for attr in RegistryMeta._indexed_attrs:
+                RegistryMeta._index(cls, attr, getattr(cls, attr, None))
+            RegistryMeta._bump()
         return cls
 
+    def __setattr__(cls, name, value):
+        if name not in RegistryMeta._indexed_attrs:
+            super().__setattr__(name, value)
+            return
+        affected = cls._inheritors(name)
+        before = [(c, getattr(c, name, None)) for c in affected]
+        super().__setattr__(name, value)
+        cls._reindex(name, before)
+
+    def __delattr__(cls, name):
+        if name not in RegistryMeta._indexed_attrs:
+            super().__delattr__(name)
+            return
+        affected = cls._inheritors(name)
+        before = [(c, getattr(c, name, None)) for c in affected]
+        super().__delattr__(name)
+        cls._reindex(name, before)
+
+    def _is_registered(cls) -> bool:
+        return RegistryMeta._registry.get(f"{cls.__module__}.{cls.__name__}") is cls
+
+    def _inheritors(cls, attr: str) -> Set[type]:
+        """``cls`` and its live subclasses that see ``cls``'s value of ``attr`` (registered ones only)."""
+        out: Set[type] = set()
+        stack = [cls]
+        while stack:
+            c = stack.pop()
+            if c in out:
+                continue
+            out.add(c)
+            # a subclass defining attr itself shadows cls for it and its descendants
+            stack.extend(sub for sub in type.__subclasses__(c) if attr not in sub.__dict__)
+        return {c for c in out if isinstance(c, RegistryMeta) and c._is_registered()}
+
+    def _reindex(cls, attr: str, before: "list[tuple[type, Any]]") -> None:
+        if not before:
+            return
+        for c, old in before:
+            RegistryMeta._unindex(c, attr, old)
+            RegistryMeta._index(c, attr, getattr(c, attr, None))
+        RegistryMeta._bump()
+
+    @staticmethod
+    def _bump() -> None:
+        RegistryMeta._generation += 1
+
+    @staticmethod
+    def _index(cls: type, attr: str, value: Any) -> None:
+        if value is None:
+            return
+        try:
+            bucket = RegistryMeta._indexes.setdefault(attr, {}).setdefault(value, weakref.WeakSet())
+        except TypeError:
+            return  # unhashable values are simply not indexed
+        bucket.add(cls)
+
+    @staticmethod
+    def _unindex(cls: type, attr: str, value: Any) -> None:
+        try:
+            bucket = RegistryMeta._indexes.get(attr, {}).get(value)
+        except TypeError:
+            return
+        if bucket is not None:
+            bucket.discard(cls)
+            if not bucket:
+                del RegistryMeta._indexes[attr][value]
+
+    @classmethod
+    def get_registry(mcls) -> Mapping[str, Type[Any]]:
+        """Return a live, read-only view of the registry (no copy)."""
+        return MappingProxyType(RegistryMeta._registry)
+
+    @classmethod
+    def add_index(mcls, attr: str) -> None:
+        """Start indexing ``attr``; existing classes are indexed once here."""
+        if attr in RegistryMeta._indexed_attrs:
+            return
+        RegistryMeta._indexed_attrs.add(attr)
+        for cls in list(RegistryMeta._registry.values()):
+            RegistryMeta._index(cls, attr, getattr(cls, attr, None))
+        RegistryMeta._bump()
+
+    @classmethod
+    def find(mcls, attr: str, value: Any) -> FrozenSet[Type[Any]]:
+        """Return the registered classes whose indexed ``attr`` equals ``value``."""
+        if attr not in RegistryMeta._indexed_attrs:
+            raise KeyError(f"attribute {attr!r} is not indexed; call add_index() first")
+        bucket = RegistryMeta._indexes.get(attr, {}).get(value)
+        return frozenset(bucket) if bucket else frozenset()
+
     @classmethod
-    def get_registry(mcls) -> Dict[str, Type[Any]]:
-        return dict(mcls._registry)
+    def generation(mcls) -> int:
+        return RegistryMeta._generation
 
 
 class RegisteredBase(metaclass=RegistryMeta):
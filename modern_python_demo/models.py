@@ -1,13 +1,15 @@
 """Data modeling: dataclasses, attrs, __slots__, descriptors, cached properties.
 
 Demonstrates memory optimization, typed fields and custom descriptors.
+
+``AttrsPoint`` is built on first access (PEP 562 module ``__getattr__``) so
+importing this module does not import ``attrs``.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Any
-import attr
 
 
 class NonNegative:
@@ -43,15 +45,29 @@ class Stats:
         return (self.total / self.count) if self.count else 0.0
 
 
-@attr.define(slots=True)
-class AttrsPoint:
-    """An attrs-based class demonstrating attrs usage and slots."""
+def _make_attrs_point() -> type:
+    import attr
+
+    @attr.define(slots=True)
+    class AttrsPoint:
+        """An attrs-based class demonstrating attrs usage and slots."""
+
+        __qualname__ = "AttrsPoint"
+
+        x: float = 0.0
+        y: float = 0.0
+
+        def distance_squared(self) -> float:
+            return self.x * self.x + self.y * self.y
+
+    return AttrsPoint
 
-    x: float = 0.0
-    y: float = 0.0
 
-    def distance_squared(self) -> float:
-        return self.x * self.x + self.y * self.y
+def __getattr__(name: str) -> Any:
+    if name == "AttrsPoint":
+        cls = globals()["AttrsPoint"] = _make_attrs_point()
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Account:
@@ -0,0 +1,231 @@
+"""Concurrent plugin dispatch with per-plugin timeouts, latency budgets and circuit breakers.
+
+`PluginDispatcher.dispatch` fans one event out to every enabled plugin at
+once. Async ``on_event`` implementations are awaited directly, sync ones run
+in a thread pool (or a process pool when a plugin's policy asks for it); an
+awaitable returned by a sync ``on_event`` (such as a :class:`LazyPlugin`
+proxying an async plugin) is awaited too.
+Plugins that keep failing or overrunning their latency budget are disabled by
+a circuit breaker and retried after a cool-down.
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import inspect
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .plugin_loader import LazyPlugin, PluginProtocol
+
+# upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the ``q`` quantile (0..1)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank and n:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+        }
+
+
+class CircuitBreaker:
+    """Opens after ``threshold`` consecutive failures, half-opens after ``reset_after`` seconds."""
+
+    def __init__(self, threshold: int = 3, reset_after: float = 30.0) -> None:
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        if self.opened_at is None:
+            return False
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            # half-open: let the next call through, one more failure re-opens
+            self.opened_at = None
+            self.failures = self.threshold - 1
+            return False
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+@dataclass(frozen=True)
+class PluginPolicy:
+    """Limits applied to one plugin.
+
+    ``executor`` is ``"thread"`` or ``"process"`` and only matters for sync
+    plugins; a process-pool plugin (and its payloads) must be picklable.
+    """
+
+    timeout: float = 5.0
+    latency_budget: float = 1.0
+    max_concurrency: int = 4
+    executor: str = "thread"
+    failure_threshold: int = 3
+    reset_after: float = 30.0
+
+
+@dataclass
+class DispatchResult:
+    plugin: str
+    ok: bool
+    elapsed: float
+    error: Optional[BaseException] = None
+    skipped: bool = False
+
+
+@dataclass
+class _PluginState:
+    plugin: PluginProtocol
+    policy: PluginPolicy
+    semaphore: asyncio.Semaphore
+    breaker: CircuitBreaker
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class PluginDispatcher:
+    """Dispatch events to plugins concurrently.
+
+    Use as an async context manager (or call :meth:`close`) so the executors
+    are shut down. Note that a timed-out sync plugin keeps its worker thread
+    busy until it returns; only the dispatcher stops waiting for it.
+    """
+
+    def __init__(
+        self,
+        plugins: Iterable[PluginProtocol],
+        *,
+        default_policy: PluginPolicy = PluginPolicy(),
+        policies: Optional[Dict[str, PluginPolicy]] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        policies = policies or {}
+        self._states: Dict[str, _PluginState] = {}
+        for p in plugins:
+            name = getattr(p, "name", repr(p))
+            policy = policies.get(name, default_policy)
+            self._states[name] = _PluginState(
+                plugin=p,
+                policy=policy,
+                semaphore=asyncio.Semaphore(policy.max_concurrency),
+                breaker=CircuitBreaker(policy.failure_threshold, policy.reset_after),
+            )
+        self._max_workers = max_workers
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[Executor] = None
+
+    def _executor(self, kind: str) -> Executor:
+        if kind == "process":
+            if self._processes is None:
+                # imported here: concurrent.futures.process is slow to import
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._processes = ProcessPoolExecutor(self._max_workers)
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(self._max_workers, thread_name_prefix="plugin")
+        return self._threads
+
+    def disabled(self) -> List[str]:
+        return [name for name, st in self._states.items() if st.breaker.is_open]
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {name: st.histogram.snapshot() for name, st in self._states.items()}
+
+    async def _invoke(self, st: _PluginState, event: str, payload: Any) -> Any:
+        plugin: Any = st.plugin
+        if isinstance(plugin, LazyPlugin) and plugin.loaded:
+            # once imported, call the real plugin so async handlers skip the executor
+            if not plugin.handles(event):
+                return None
+            plugin = plugin.load()
+        handler = plugin.on_event
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(event, payload)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor(st.policy.executor), partial(handler, event, payload))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _call(self, name: str, st: _PluginState, event: str, payload: Any) -> DispatchResult:
+        if st.breaker.is_open:
+            return DispatchResult(name, ok=False, elapsed=0.0, skipped=True)
+        async with st.semaphore:
+            start = time.perf_counter()
+            error: Optional[BaseException] = None
+            try:
+                await asyncio.wait_for(self._invoke(st, event, payload), st.policy.timeout)
+            except Exception as e:
+                error = e
+            elapsed = time.perf_counter() - start
+        st.histogram.record(elapsed)
+        if error is not None or elapsed > st.policy.latency_budget:
+            st.breaker.record_failure()
+        else:
+            st.breaker.record_success()
+        return DispatchResult(name, ok=error is None, elapsed=elapsed, error=error)
+
+    async def dispatch(self, event: str, payload: Any) -> List[DispatchResult]:
+        """Send ``event`` to every plugin concurrently and collect the outcomes."""
+        return list(
+            await asyncio.gather(*(self._call(name, st, event, payload) for name, st in self._states.items()))
+        )
+
+    def close(self) -> None:
+        if self._threads is not None:
+            self._threads.shutdown(wait=False)
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown(wait=False)
+            self._processes = None
+
+    async def __aenter__(self) -> "PluginDispatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
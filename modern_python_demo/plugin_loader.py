@@ -2,12 +2,24 @@
 
 Provides dynamic discovery of plugins under the `modern_python_demo.plugins`
 package and exposes a `discover_plugins` helper.
+
+`discover_plugins_lazy` is the fast-startup alternative: it reads a cached
+manifest (or `importlib.metadata` entry points) describing each plugin and the
+events it handles, and only imports a plugin module the first time one of
+those events fires.
 """
 from __future__ import annotations
 
+import json
+import os
 import pkgutil
 import importlib
-from typing import List, Protocol, runtime_checkable, Any
+import time
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Sequence, Tuple, runtime_checkable
+
+ENTRY_POINT_GROUP = "modern_python_demo.plugins"
+MANIFEST_VERSION = 1
+ALL_EVENTS = "*"
 
 
 @runtime_checkable
@@ -19,6 +31,25 @@ class PluginProtocol(Protocol):
     def on_event(self, event: str, payload: Any) -> None: ...
 
 
+def _iter_plugin_objects(mod: Any) -> Iterator[Tuple[str, PluginProtocol]]:
+    """Yield ``(attribute, instance)`` for each plugin class found in ``mod``."""
+    for attr in dir(mod):
+        obj = getattr(mod, attr)
+        try:
+            if isinstance(obj, type) and issubclass(obj, object) and hasattr(obj, "on_event"):
+                inst = obj()
+                if isinstance(inst, PluginProtocol):
+                    yield attr, inst
+        except Exception:
+            # fallback: if instance matches protocol at runtime
+            try:
+                inst = obj
+                if isinstance(inst, PluginProtocol):
+                    yield attr, inst
+            except Exception:
+                continue
+
+
 def discover_plugins(package_name: str = "modern_python_demo.plugins") -> List[PluginProtocol]:
     plugins: List[PluginProtocol] = []
     pkg = importlib.import_module(package_name)
@@ -30,19 +61,167 @@ def discover_plugins(package_name: str = "modern_python_demo.plugins") -> List[P
             print(f"Failed importing plugin module {name}: {e}")
             continue
         # find plugin objects
-        for attr in dir(mod):
-            obj = getattr(mod, attr)
-            try:
-                if isinstance(obj, type) and issubclass(obj, object) and hasattr(obj, "on_event"):
-                    inst = obj()
-                    if isinstance(inst, PluginProtocol):
-                        plugins.append(inst)
-            except Exception:
-                # fallback: if instance matches protocol at runtime
-                try:
-                    inst = obj
-                    if isinstance(inst, PluginProtocol):
-                        plugins.append(inst)
-                except Exception:
-                    continue
+        plugins.extend(inst for _, inst in _iter_plugin_objects(mod))
+    return plugins
+
+
+class LazyPlugin:
+    """Placeholder for a plugin whose module has not been imported yet.
+
+    It satisfies :class:`PluginProtocol`; ``on_event`` ignores events the
+    plugin did not declare and imports/instantiates the real plugin on the
+    first event it does handle. Whatever the real ``on_event`` returns is
+    passed through, so for an async plugin the caller gets the coroutine to
+    await.
+    """
+
+    def __init__(self, name: str, module: str, attr: str, events: Sequence[str] = (ALL_EVENTS,)) -> None:
+        self.name = name
+        self.module = module
+        self.attr = attr
+        self.events = frozenset(events)
+        self.discovery_time = 0.0
+        self.load_time: Optional[float] = None
+        self._plugin: Optional[PluginProtocol] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._plugin is not None
+
+    def handles(self, event: str) -> bool:
+        return ALL_EVENTS in self.events or event in self.events
+
+    def load(self) -> PluginProtocol:
+        if self._plugin is None:
+            start = time.perf_counter()
+            obj = getattr(importlib.import_module(self.module), self.attr)
+            self._plugin = obj() if isinstance(obj, type) else obj
+            self.load_time = time.perf_counter() - start
+        return self._plugin
+
+    def on_event(self, event: str, payload: Any) -> Any:
+        if self.handles(event):
+            return self.load().on_event(event, payload)
+        return None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "pending"
+        return f"LazyPlugin({self.name!r}, {self.module}:{self.attr}, {state})"
+
+
+def _module_mtimes(pkg: Any) -> Dict[str, int]:
+    """Map each plugin module in ``pkg`` to its source file mtime (ns)."""
+    mtimes: Dict[str, int] = {}
+    for finder, name, ispkg in pkgutil.iter_modules(pkg.__path__, pkg.__name__ + "."):
+        spec = finder.find_spec(name) if hasattr(finder, "find_spec") else None
+        origin = getattr(spec, "origin", None)
+        try:
+            mtimes[name] = os.stat(origin).st_mtime_ns if origin else 0
+        except OSError:
+            mtimes[name] = 0
+    return mtimes
+
+
+def _default_manifest_path(pkg: Any) -> str:
+    return os.path.join(list(pkg.__path__)[0], "__pycache__", "plugin_manifest.json")
+
+
+def _read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return None
+    return data
+
+
+def _write_manifest(path: str, data: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf8") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp, path)
+    except OSError as e:
+        # a read-only install just means we rebuild the manifest next time
+        print(f"Could not write plugin manifest {path}: {e}")
+
+
+def build_manifest(package_name: str = "modern_python_demo.plugins") -> Dict[str, Any]:
+    """Import every plugin module once and describe its plugins."""
+    pkg = importlib.import_module(package_name)
+    modules: Dict[str, Any] = {}
+    for name, mtime in _module_mtimes(pkg).items():
+        start = time.perf_counter()
+        entries = []
+        try:
+            mod = importlib.import_module(name)
+        except Exception as e:
+            # keep the module in the manifest so it is retried only when it changes
+            print(f"Failed importing plugin module {name}: {e}")
+        else:
+            for attr, inst in _iter_plugin_objects(mod):
+                events = getattr(inst, "events", None) or (ALL_EVENTS,)
+                entries.append({"name": inst.name, "attr": attr, "events": sorted(events)})
+        modules[name] = {"mtime": mtime, "scan_time": time.perf_counter() - start, "plugins": entries}
+    return {"version": MANIFEST_VERSION, "package": package_name, "modules": modules}
+
+
+def _entry_point_plugins(group: str) -> List[LazyPlugin]:
+    from importlib.metadata import entry_points
+
+    plugins: List[LazyPlugin] = []
+    for ep in entry_points(group=group):
+        start = time.perf_counter()
+        plugin = LazyPlugin(ep.name, ep.module, ep.attr or ep.name)
+        plugin.discovery_time = time.perf_counter() - start
+        plugins.append(plugin)
+    return plugins
+
+
+def discover_plugins_lazy(
+    package_name: str = "modern_python_demo.plugins",
+    *,
+    manifest_path: Optional[str] = None,
+    use_entry_points: bool = False,
+    entry_point_group: str = ENTRY_POINT_GROUP,
+) -> List[LazyPlugin]:
+    """Discover plugins without importing them.
+
+    The manifest at ``manifest_path`` (by default next to the plugin package's
+    bytecode cache) is reused as long as the set of plugin modules and their
+    file mtimes are unchanged; otherwise it is rebuilt, which imports each
+    module once. With ``use_entry_points`` the installed entry points in
+    ``entry_point_group`` are added as well; their events are not known until
+    import, so they are treated as handling every event.
+
+    Each returned plugin records ``discovery_time`` (seconds spent finding it)
+    and, once imported, ``load_time``.
+    """
+    pkg = importlib.import_module(package_name)
+    path = manifest_path or _default_manifest_path(pkg)
+    mtimes = _module_mtimes(pkg)
+    manifest = _read_manifest(path)
+    stale = (
+        manifest is None
+        or manifest.get("package") != package_name
+        or {name: info.get("mtime") for name, info in manifest["modules"].items()} != mtimes
+    )
+    if stale:
+        manifest = build_manifest(package_name)
+        _write_manifest(path, manifest)
+
+    plugins: List[LazyPlugin] = []
+    assert manifest is not None
+    for module, info in manifest["modules"].items():
+        for entry in info["plugins"]:
+            start = time.perf_counter()
+            plugin = LazyPlugin(entry["name"], module, entry["attr"], entry["events"])
+            # a rebuilt manifest already paid for the import: attribute it
+            plugin.discovery_time = (time.perf_counter() - start) + (info["scan_time"] if stale else 0.0)
+            plugins.append(plugin)
+    if use_entry_points:
+        plugins.extend(_entry_point_plugins(entry_point_group))
     return plugins
@@ -0,0 +1,154 @@
+"""Low-overhead sampling profiler with collapsed-stack (flame graph) output.
+
+A background thread reads ``sys._current_frames()`` every ``interval``
+seconds and counts the stacks it sees. When a thread is running an asyncio
+event loop, the stack is rooted at the current task's name, so flame graphs
+split per task. The sampler measures its own cost and stretches the interval
+so that sampling stays under ``max_overhead`` of wall time (1% by default).
+
+Output is in the "collapsed" format understood by flamegraph.pl and
+speedscope: one ``frame;frame;frame count`` line per distinct stack.
+
+    with SamplingProfiler() as prof:
+        run_workload()
+    prof.write_collapsed("profile.folded")
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, Optional, Tuple
+
+Stack = Tuple[str, ...]
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _running_tasks() -> Dict[int, str]:
+    """Map thread id -> name of the asyncio task currently running on it.
+
+    Relies on CPython internals (the loop's ``_thread_id`` and asyncio's
+    current-task table); returns what it can and nothing on other runtimes.
+    """
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        return {}
+    current = getattr(asyncio.tasks, "_current_tasks", None)
+    if not current:
+        return {}
+    out: Dict[int, str] = {}
+    try:
+        for loop, task in list(current.items()):
+            tid = getattr(loop, "_thread_id", None)
+            if tid is not None and task is not None:
+                out[tid] = task.get_name()
+    except RuntimeError:  # the table changed size while we were reading it
+        pass
+    return out
+
+
+class SamplingProfiler:
+    """Sample every thread's stack from a daemon thread.
+
+    Stacks deeper than ``max_depth`` keep their innermost frames, placed under
+    a ``[truncated]`` frame below the thread or task root.
+    """
+
+    def __init__(self, interval: float = 0.005, *, max_overhead: float = 0.01, max_depth: int = 128) -> None:
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.max_depth = max_depth
+        self.samples: "Counter[Stack]" = Counter()
+        self.sample_count = 0
+        self.sampling_time = 0.0
+        self._started_at: Optional[float] = None
+        self._elapsed = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> "SamplingProfiler":
+        if self._thread is None:
+            self._stop.clear()
+            self._started_at = time.perf_counter()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        if self._started_at is not None:
+            self._elapsed += time.perf_counter() - self._started_at
+            self._started_at = None
+
+    def __enter__(self) -> "SamplingProfiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        me = threading.get_ident()
+        clock = time.perf_counter
+        while not self._stop.is_set():
+            start = clock()
+            self._sample(me)
+            cost = clock() - start
+            self.sampling_time += cost
+            # sleep long enough that cost / (cost + sleep) <= max_overhead
+            self._stop.wait(max(self.interval, cost / self.max_overhead - cost))
+
+    def _sample(self, skip: int) -> None:
+        tasks = _running_tasks()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for tid, frame in sys._current_frames().items():
+            if tid == skip:
+                continue
+            stack = []
+            f: Optional[FrameType] = frame
+            while f is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(f))
+                f = f.f_back
+            if f is not None:
+                # outer frames were dropped; keep the innermost ones off the root itself
+                stack.append("[truncated]")
+            stack.append(f"task:{tasks[tid]}" if tid in tasks else f"thread:{names.get(tid, tid)}")
+            stack.reverse()
+            self.samples[tuple(stack)] += 1
+        self.sample_count += 1
+
+    @property
+    def overhead(self) -> float:
+        """Fraction of wall time spent sampling so far."""
+        elapsed = self._elapsed + (time.perf_counter() - self._started_at if self._started_at else 0.0)
+        return self.sampling_time / elapsed if elapsed else 0.0
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks, most frequent first."""
+        return "".join(f"{';'.join(stack)} {n}\n" for stack, n in self.samples.most_common())
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf8") as f:
+            f.write(self.collapsed())
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self.sample_count = 0
+        self.sampling_time = 0.0
+        self._elapsed = 0.0
+        if self._started_at is not None:
+            self._started_at = time.perf_counter()
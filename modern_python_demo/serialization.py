@@ -8,10 +8,7 @@ import json
 import pickle
 from typing import Any, Dict
 
-try:
-    import yaml
-except Exception:
-    yaml = None  # optional dependency
+from ._lazy import optional_module
 
 
 CURRENT_VERSION = "1.0"
@@ -39,12 +36,14 @@ def loads_pickle(b: bytes) -> Dict[str, Any]:
 
 
 def dumps_yaml(obj: Any) -> str:
+    yaml = optional_module("yaml")  # optional dependency, imported on first use
     if yaml is None:
         raise RuntimeError("PyYAML not installed")
     return yaml.safe_dump({"__version__": CURRENT_VERSION, "data": obj})
 
 
 def loads_yaml(s: str) -> Dict[str, Any]:
+    yaml = optional_module("yaml")
     if yaml is None:
         raise RuntimeError("PyYAML not installed")
     payload = yaml.safe_load(s)
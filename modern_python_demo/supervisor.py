@@ -0,0 +1,294 @@
+"""Multi-process supervisor for DemoTask-style workloads.
+
+:class:`Supervisor` starts N worker processes (one per core by default), each
+with its own event loop, :class:`EventBroker` and :class:`Scheduler`. Tasks
+are any picklable object with an ``async run(broker)`` method.
+
+Each worker has a private pair of pipes and the parent hands out work on
+demand: a worker is sent a new task whenever one of its ``concurrency`` slots
+frees up, so fast workers naturally take more of the backlog. Private pipes
+(rather than one shared ``multiprocessing.Queue``) mean a worker dying in the
+middle of a read or write cannot leave a shared lock held and stall the rest.
+
+The parent restarts workers that die and re-queues the tasks they had in
+flight (so a task may run more than once after a crash), stops everything
+gracefully on SIGTERM, and aggregates the metrics each worker reports. If
+the parent has called :func:`~modern_python_demo.errors.configure_logging`,
+each worker starts its own logging pipeline at the same level.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing as mp
+import os
+import signal
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from typing import Any, Deque, Dict, Iterable, Optional, Set, Tuple
+
+from . import errors
+from .events import EventBroker, Scheduler
+
+_POLL = 0.1
+
+
+def _worker_main(
+    task_conn: Connection, result_conn: Connection, concurrency: int, metrics_interval: float, log_level: Optional[int]
+) -> None:
+    # only the parent decides when workers stop; Ctrl-C in a terminal reaches every process
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if log_level is not None:
+        # a forked worker inherits the parent's queue handler but not the
+        # listener thread that drains it (a spawned one has neither): start its own
+        errors.shutdown_logging()
+        errors.configure_logging(log_level)
+    try:
+        asyncio.run(_worker_loop(task_conn, result_conn, concurrency, metrics_interval))
+    finally:
+        if log_level is not None:
+            # multiprocessing ends workers without running atexit hooks
+            errors.shutdown_logging()
+
+
+async def _worker_loop(task_conn: Connection, result_conn: Connection, concurrency: int, metrics_interval: float) -> None:
+    loop = asyncio.get_running_loop()
+    broker = EventBroker()
+    scheduler = Scheduler()
+    inbox: "asyncio.Queue[Optional[Tuple[int, Any]]]" = asyncio.Queue()
+    metrics = {"tasks_done": 0, "errors": 0, "busy_time": 0.0, "pid": os.getpid()}
+
+    def reader() -> None:
+        # a daemon thread, so a blocked recv() never holds up interpreter exit
+        while True:
+            try:
+                item = task_conn.recv()
+            except (EOFError, OSError):
+                item = None
+            loop.call_soon_threadsafe(inbox.put_nowait, item)
+            if item is None:
+                return
+
+    def stop() -> None:
+        inbox.put_nowait(None)
+
+    threading.Thread(target=reader, name="supervisor-inbox", daemon=True).start()
+    if hasattr(signal, "SIGTERM"):
+        loop.add_signal_handler(signal.SIGTERM, stop)
+
+    async def report() -> None:
+        result_conn.send(("metrics", dict(metrics)))
+
+    scheduler.schedule_periodic(report, metrics_interval)
+
+    async def consume() -> None:
+        while True:
+            item = await inbox.get()
+            if item is None:
+                inbox.put_nowait(None)  # let the other consumers see it too
+                return
+            task_id, task = item
+            start = time.perf_counter()
+            ok = True
+            try:
+                await task.run(broker)
+            except Exception:
+                ok = False
+            metrics["busy_time"] += time.perf_counter() - start
+            metrics["tasks_done" if ok else "errors"] += 1
+            result_conn.send(("done", task_id, ok))
+
+    try:
+        await asyncio.gather(*(consume() for _ in range(concurrency)))
+    finally:
+        scheduler.cancel_all()
+        await report()
+
+
+@dataclass
+class SupervisorReport:
+    completed: int
+    failed: int
+    restarts: int
+    elapsed: float
+    # last metrics reported by each worker process, by pid; a crashed worker's
+    # counts only cover what it reported before dying
+    workers: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def totals(self) -> Dict[str, float]:
+        out: Dict[str, float] = {}
+        for m in self.workers.values():
+            for k in ("tasks_done", "errors", "busy_time"):
+                out[k] = out.get(k, 0) + m.get(k, 0)
+        return out
+
+
+@dataclass
+class _Worker:
+    process: Any
+    tasks: Connection
+    results: Connection
+    assigned: Set[int] = field(default_factory=set)
+
+
+class Supervisor:
+    """Run tasks across worker processes.
+
+    ``concurrency`` is the number of tasks each worker runs at once on its
+    event loop. A task whose worker crashes is re-queued up to
+    ``max_task_retries`` times before it counts as failed; workers are
+    restarted at most ``max_restarts`` times in total.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        concurrency: int = 4,
+        max_restarts: int = 10,
+        max_task_retries: int = 2,
+        metrics_interval: float = 1.0,
+        shutdown_timeout: float = 5.0,
+        start_method: Optional[str] = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.max_restarts = max_restarts
+        self.max_task_retries = max_task_retries
+        self.metrics_interval = metrics_interval
+        self.shutdown_timeout = shutdown_timeout
+        if start_method is None and "fork" in mp.get_all_start_methods():
+            start_method = "fork"
+        self._ctx = mp.get_context(start_method)
+        self._stopping = False
+
+    def request_stop(self, *_: Any) -> None:
+        """Stop handing out work; running tasks finish. Installed as the SIGTERM handler."""
+        self._stopping = True
+
+    def _spawn(self) -> _Worker:
+        task_r, task_w = self._ctx.Pipe(duplex=False)
+        result_r, result_w = self._ctx.Pipe(duplex=False)
+        # workers log like the parent if configure_logging() was called there
+        log_level = errors.logger.level if errors._listener is not None else None
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(task_r, result_w, self.concurrency, self.metrics_interval, log_level),
+            daemon=True,
+        )
+        proc.start()
+        # the child owns these ends now
+        task_r.close()
+        result_w.close()
+        return _Worker(proc, task_w, result_r)
+
+    def run(self, tasks: Iterable[Any]) -> SupervisorReport:
+        """Run ``tasks`` to completion (or until SIGTERM) and return the aggregated report."""
+        pending: Dict[int, Any] = dict(enumerate(tasks))
+        backlog: Deque[int] = deque(pending)
+        attempts: Dict[int, int] = {}
+        metrics: Dict[int, Dict[str, Any]] = {}
+        counts = {"completed": 0, "failed": 0, "restarts": 0}
+
+        previous = None
+        if hasattr(signal, "SIGTERM") and threading.current_thread() is threading.main_thread():
+            previous = signal.signal(signal.SIGTERM, self.request_stop)
+        started = time.perf_counter()
+        workers = {wid: self._spawn() for wid in range(self.workers)}
+
+        def handle(wid: int, msg: Tuple[Any, ...]) -> None:
+            if msg[0] == "metrics":
+                # keyed by pid so a restarted worker does not overwrite its predecessor
+                metrics[msg[1]["pid"]] = {"worker": wid, **msg[1]}
+            elif msg[0] == "done":
+                workers[wid].assigned.discard(msg[1])
+                if pending.pop(msg[1], None) is not None:
+                    counts["completed" if msg[2] else "failed"] += 1
+
+        def fill(w: _Worker) -> None:
+            while backlog and len(w.assigned) < self.concurrency and not self._stopping:
+                tid = backlog.popleft()
+                w.assigned.add(tid)
+                w.tasks.send((tid, pending[tid]))
+
+        def reap(wid: int) -> None:
+            w = workers.pop(wid)
+            w.process.join()
+            for tid in w.assigned:
+                attempts[tid] = attempts.get(tid, 0) + 1
+                if attempts[tid] > self.max_task_retries:
+                    pending.pop(tid, None)
+                    counts["failed"] += 1
+                else:
+                    backlog.appendleft(tid)
+            w.tasks.close()
+            w.results.close()
+            if counts["restarts"] < self.max_restarts and not self._stopping:
+                counts["restarts"] += 1
+                workers[wid] = self._spawn()
+            elif not workers:
+                raise RuntimeError("all workers died and the restart limit was reached")
+
+        try:
+            while pending and not self._stopping:
+                for w in workers.values():
+                    fill(w)
+                by_handle: Dict[Any, Tuple[int, bool]] = {}
+                for wid, w in workers.items():
+                    by_handle[w.results] = (wid, False)
+                    by_handle[w.process.sentinel] = (wid, True)
+                dead = set()
+                for ready in wait(list(by_handle), _POLL):
+                    wid, is_exit = by_handle[ready]
+                    if is_exit:
+                        dead.add(wid)
+                        continue
+                    try:
+                        handle(wid, workers[wid].results.recv())
+                    except EOFError:
+                        dead.add(wid)
+                for wid in dead:
+                    # pick up anything it managed to report before dying
+                    while workers[wid].results.poll():
+                        try:
+                            handle(wid, workers[wid].results.recv())
+                        except EOFError:
+                            break
+                    reap(wid)
+        finally:
+            self._shutdown(workers, handle)
+            if previous is not None:
+                signal.signal(signal.SIGTERM, previous)
+
+        return SupervisorReport(
+            counts["completed"], counts["failed"], counts["restarts"], time.perf_counter() - started, metrics
+        )
+
+    def _shutdown(self, workers: Dict[int, _Worker], handle: Any) -> None:
+        """Ask every worker to finish its running tasks and exit, then collect final metrics."""
+        for w in workers.values():
+            try:
+                w.tasks.send(None)
+            except OSError:
+                pass
+        deadline = time.monotonic() + self.shutdown_timeout
+        for wid, w in workers.items():
+            while w.process.is_alive() and time.monotonic() < deadline:
+                if w.results.poll(_POLL):
+                    try:
+                        handle(wid, w.results.recv())
+                    except EOFError:
+                        break
+            if w.process.is_alive():
+                w.process.terminate()
+            w.process.join()
+            while w.results.poll():
+                try:
+                    handle(wid, w.results.recv())
+                except EOFError:
+                    break
+            w.tasks.close()
+            w.results.close()
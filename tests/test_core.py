@@ -64,3 +64,533 @@ def test_memoize_decorator():
 
     assert add(1, 2) == 3
     assert add(1, b=2) == 3
+
+
+def test_temp_config_is_context_local():
+    from modern_python_demo.config import Config, current_config, get_setting, temp_config
+
+    async def child():
+        return get_setting("debug"), get_setting("interval")
+
+    async def run():
+        with temp_config(debug=True):
+            with temp_config(interval=0.5) as cfg:
+                assert cfg.debug and cfg.interval == 0.5
+                inside = await asyncio.create_task(child())
+        return inside
+
+    assert asyncio.run(run()) == (True, 0.5)
+    assert current_config().debug is False
+
+    # pushing and reading settings never builds a merged Config, but the
+    # yielded view still behaves like one
+    import dataclasses
+
+    with temp_config(debug=True) as cfg:
+        assert cfg.debug is True and get_setting("interval") == 1.0
+        assert cfg._layer._view is None
+        assert isinstance(cfg, Config) and cfg == Config(debug=True) == cfg
+        assert vars(cfg) == dataclasses.asdict(cfg) == dataclasses.asdict(Config(debug=True))
+        assert current_config() == cfg
+
+
+def test_lazy_plugin_discovery_uses_manifest(tmp_path, monkeypatch):
+    from modern_python_demo import plugin_loader
+
+    manifest = str(tmp_path / "manifest.json")
+    first = plugin_loader.discover_plugins_lazy(manifest_path=manifest)
+    assert "sample" in [p.name for p in first]
+
+    def no_rebuild(*args, **kwargs):
+        raise AssertionError("manifest should have been reused")
+
+    monkeypatch.setattr(plugin_loader, "build_manifest", no_rebuild)
+    plugins = plugin_loader.discover_plugins_lazy(manifest_path=manifest)
+    sample = next(p for p in plugins if p.name == "sample")
+    assert not sample.loaded
+    sample.on_event("init", {})
+    assert sample.loaded and sample.load_time is not None
+
+
+def test_lazy_plugin_passes_through_async_handler(tmp_path, monkeypatch):
+    from modern_python_demo.plugin_loader import LazyPlugin
+
+    (tmp_path / "async_plugin_mod.py").write_text(
+        "calls = []\n"
+        "class P:\n"
+        "    name = 'async'\n"
+        "    async def on_event(self, event, payload):\n"
+        "        calls.append(event)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    lazy = LazyPlugin("async", "async_plugin_mod", "P")
+    asyncio.run(lazy.on_event("init", {}))
+    import async_plugin_mod
+
+    assert async_plugin_mod.calls == ["init"]
+
+    from modern_python_demo.plugin_dispatch import PluginDispatcher
+
+    async def dispatch_twice():
+        async with PluginDispatcher([LazyPlugin("async2", "async_plugin_mod", "P")]) as d:
+            return await d.dispatch("a", {}) + await d.dispatch("b", {})
+
+    assert all(r.ok for r in asyncio.run(dispatch_twice()))
+    assert async_plugin_mod.calls == ["init", "a", "b"]
+
+
+def test_plugin_dispatcher_trips_breaker_on_slow_plugin():
+    import time
+    from modern_python_demo.plugin_dispatch import PluginDispatcher, PluginPolicy
+
+    class Fast:
+        name = "fast"
+
+        async def on_event(self, event, payload):
+            payload.append(self.name)
+
+    class Slow:
+        name = "slow"
+
+        def on_event(self, event, payload):
+            time.sleep(0.05)
+
+    async def run():
+        policy = PluginPolicy(timeout=0.01, failure_threshold=2)
+        async with PluginDispatcher([Fast(), Slow()], policies={"slow": policy}) as d:
+            seen = []
+            for _ in range(3):
+                results = await d.dispatch("e", seen)
+            return seen, {r.plugin: r for r in results}, d.disabled()
+
+    seen, last, disabled = asyncio.run(run())
+    assert seen == ["fast"] * 3
+    assert last["fast"].ok and last["slow"].skipped
+    assert disabled == ["slow"]
+
+
+def test_registry_indexes_and_weak_entries():
+    import gc
+    from modern_python_demo.decorators import with_metadata
+    from modern_python_demo.metaclasses import RegisteredBase, RegistryMeta
+
+    RegistryMeta.add_index("author")
+    gen = RegistryMeta.generation()
+    Tagged = with_metadata(author="test-registry")(type("Tagged", (RegisteredBase,), {}))
+    assert RegistryMeta.generation() > gen
+    assert RegistryMeta.find("author", "test-registry") == {Tagged}
+    assert Tagged in RegistryMeta.find("version", "0.1")
+    key = f"{Tagged.__module__}.Tagged"
+    assert RegistryMeta.get_registry()[key] is Tagged
+
+    del Tagged
+    gc.collect()
+    assert key not in RegistryMeta.get_registry()
+    assert RegistryMeta.find("author", "test-registry") == frozenset()
+
+
+def test_registry_reindexes_inheriting_subclasses():
+    from modern_python_demo.metaclasses import RegisteredBase, RegistryMeta
+
+    class IdxBase(RegisteredBase):
+        version = "idx-1"
+
+    class IdxSub(IdxBase):
+        pass
+
+    class IdxOwn(IdxBase):
+        version = "idx-own"
+
+    IdxBase.version = "idx-2"
+    assert RegistryMeta.find("version", "idx-2") == {IdxBase, IdxSub}
+    assert RegistryMeta.find("version", "idx-own") == {IdxOwn}
+    assert "idx-1" not in RegistryMeta._indexes["version"]
+
+    del IdxBase.version
+    assert RegistryMeta.find("version", "idx-2") == frozenset()
+    assert "idx-2" not in RegistryMeta._indexes["version"]
+
+
+def test_introspect_compiled_binder_and_adapter():
+    import inspect
+
+    import pytest
+
+    def handler(a, b=2, /, c=3, *rest, d, e=5, **extra):
+        return a, b, c, rest, d, e, extra
+
+    bind = introspect.compile_binder(handler)
+    expected = inspect.signature(handler).bind(1, 9, 8, 7, d=4, z=0)
+    expected.apply_defaults()
+    assert bind(1, 9, 8, 7, d=4, z=0) == dict(expected.arguments)
+    assert introspect.compile_binder(handler) is bind
+
+    adapt = introspect.compile_adapter(handler)
+    assert adapt({"a": 1, "d": 4, "unused": 0}) == (1, 2, 3, (), 4, 5, {})
+
+    class Obj:
+        def on_event(self, event, payload=None):
+            return self, event, payload
+
+        def star(*args):
+            return args
+
+    obj = Obj()
+    assert introspect.cached_signature(obj.star) == inspect.signature(obj.star)
+    assert introspect.cached_signature(obj.on_event) is introspect.cached_signature(obj.on_event)
+    assert introspect.compile_binder(obj.on_event) is introspect.compile_binder(obj.on_event)
+    assert introspect.compile_binder(obj.on_event)("e") == {"event": "e", "payload": None}
+    assert introspect.compile_adapter(obj.on_event)({"event": "e"}) == (obj, "e", None)
+    assert introspect.compile_adapter(Obj().star)({}) and introspect._METHOD_ADAPTERS
+
+    import gc
+
+    # the adapter keeps its target alive; only the cache is weak
+    scale = introspect.compile_adapter(lambda x, y=2: x * y)
+    add = introspect.compile_adapter(introspect.make_adder(10))
+    gc.collect()
+    assert scale({"x": 3}) == 6 and add({"y": 1}) == 11
+
+    f = introspect.factory_from_spec("triple", multiplier=3, compiled=True)
+    assert f(5) == 15 and f.__closure__ is None and f.__name__ == "triple"
+    half = introspect.factory_from_spec("half", multiplier=2.5, compiled=True)
+    assert half(2) == introspect.factory_from_spec("half", multiplier=2.5)(2) == 5.0
+    with pytest.raises(TypeError):
+        introspect.factory_from_spec("bad", multiplier="2", compiled=True)
+
+
+def test_main_import_skips_heavy_dependencies():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, modern_python_demo, modern_python_demo.main; "
+        "print(modern_python_demo.__version__, "
+        "sorted(m for m in ('yaml', 'attr', 'importlib.metadata', 'pkgutil') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    version, loaded = out.split(" ", 1)
+    assert version.count(".") == 2
+    assert loaded.strip() == "[]"
+
+
+def test_logging_pipeline_rate_limits_duplicates():
+    import io
+    import time
+    from modern_python_demo import errors
+
+    out = io.StringIO()
+    errors.configure_logging(stream=out, burst=2, interval=60)
+    try:
+        for _ in range(5):
+            errors.logger.error("disk %s is full", "sda")
+        errors.logger.warning("other")
+    finally:
+        errors.shutdown_logging()
+    lines = out.getvalue().splitlines()
+    assert lines == [
+        "[ERROR] modern_python_demo - disk sda is full",
+        "[ERROR] modern_python_demo - disk sda is full",
+        "[WARNING] modern_python_demo - other",
+        "[ERROR] modern_python_demo - disk sda is full (suppressed 3 similar messages)",
+    ]
+
+    # an expired window is reported by the listener without another record or shutdown
+    out = io.StringIO()
+    errors.configure_logging(stream=out, burst=1, interval=0.05)
+    try:
+        for _ in range(4):
+            errors.logger.error("quiet")
+        deadline = time.monotonic() + 2
+        while "suppressed" not in out.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert out.getvalue().splitlines() == [
+            "[ERROR] modern_python_demo - quiet",
+            "[ERROR] modern_python_demo - quiet (suppressed 3 similar messages)",
+        ]
+    finally:
+        errors.shutdown_logging()
+    assert out.getvalue().count("suppressed") == 1
+
+
+def test_benchmark_baseline_roundtrip_and_compare(tmp_path, monkeypatch):
+    from modern_python_demo import benchmark
+
+    results = benchmark.run_suite(["cache.fib"], sizes=[20], number=2, repeat=3, warmup=1)
+    path = str(tmp_path / "baseline.json")
+    benchmark.save_baseline(results, path)
+    baseline = benchmark.load_baseline(path)
+    assert benchmark.compare(results, baseline) == []
+
+    slower = {k: benchmark.BenchResult(**{**vars(r), "p50": r.p50 * 2}) for k, r in results.items()}
+    assert [m.split(":")[0] for m in benchmark.compare(slower, baseline, 0.5)] == ["cache.fib[20]"]
+
+    closed = []
+    monkeypatch.setitem(benchmark.CASES, "with_cleanup", (lambda size: (lambda: None, lambda: closed.append(size)), (1, 2)))
+    assert list(benchmark.run_suite(["with_cleanup"], number=1, repeat=1, warmup=0)) == [
+        "with_cleanup[1]",
+        "with_cleanup[2]",
+    ]
+    assert closed == [1, 2]
+
+
+def test_load_generator_reports_throughput():
+    from modern_python_demo.loadgen import parse_mix, run_load
+
+    report = asyncio.run(run_load(concurrency=4, duration=0.25, mix=parse_mix("sync=1,async=1,slow=1"), slow_delay=0.01))
+    assert report.tasks >= 4 and report.errors == 0
+    assert report.events == 2 * report.tasks
+    assert report.emit_p99 >= report.emit_p50 > 0
+
+
+def test_service_batch_executors_preserve_order():
+    import pytest
+    from modern_python_demo.interfaces import (
+        ProcessPoolServiceExecutor,
+        ServiceExecutor,
+        ThreadPoolServiceExecutor,
+        UpperService,
+    )
+
+    svc = UpperService()
+    items = [f"item{i}" for i in range(25)]
+    expected = [s.upper() for s in items]
+    assert svc.process_many(items) == expected
+    with ThreadPoolServiceExecutor(svc, max_workers=3, chunk_size=4) as ex:
+        assert ex.map(items) == expected
+        assert asyncio.run(svc.aprocess_many(items, ex)) == expected
+        with pytest.raises(ValueError):
+            asyncio.run(UpperService().aprocess_many(items, ex))
+    with pytest.raises(TypeError):
+        ServiceExecutor(svc)
+    with ProcessPoolServiceExecutor(svc, max_workers=2, chunk_size=10) as ex:
+        assert ex.map(items) == expected
+    assert asyncio.run(svc.aprocess_many(items)) == expected
+
+
+def test_memory_subsystem_reports_and_snapshot_diff():
+    import sys
+    from modern_python_demo import memory
+
+    broker = EventBroker()
+    for i in range(50):
+        broker.subscribe("mem", lambda event, payload: None)
+
+    @memoize_with_limit(100)
+    def ident(x):
+        return x
+
+    for i in range(30):
+        ident(i)
+    reports = {r.name: r for r in memory.subsystem_reports()}
+    assert reports["events.EventBroker"].objects >= 50
+    assert reports["decorators.memoize_with_limit"].objects >= 30
+    assert reports["events.EventBroker"].deep_size > 0
+
+    cache.fib.cache_clear()
+    cache.fib(300)  # maxsize 256, so keys 45..300 stay cached
+    expected = sum(sys.getsizeof(k) + sys.getsizeof(cache.fib(k)) for k in range(45, 301))
+    assert memory._fib_report().deep_size == expected
+
+    memory.start_tracing()
+    try:
+        before = memory.take_snapshot()
+        grown = [EventBroker() for _ in range(100)]
+        diffs = memory.diff_snapshots(before, memory.take_snapshot())
+        assert any(d.size_diff > 0 and "events.py" in str(d.traceback) for d in diffs)
+        assert "Allocation growth" in memory.memory_report(baseline=before)
+    finally:
+        memory.stop_tracing()
+
+
+class _CrashOnceTask:
+    """Kills its worker process the first time it runs."""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    async def run(self, broker):
+        import os
+
+        if not os.path.exists(self.marker):
+            open(self.marker, "w").close()
+            os._exit(1)
+        await broker.emit("task.finished", {})
+
+
+def test_supervisor_runs_tasks_and_restarts_crashed_workers(tmp_path):
+    from modern_python_demo.main import DemoTask
+    from modern_python_demo.supervisor import Supervisor
+
+    tasks = [DemoTask(f"t{i}") for i in range(6)] + [_CrashOnceTask(str(tmp_path / "crashed"))]
+    report = Supervisor(workers=2, concurrency=2, metrics_interval=0.05).run(tasks)
+    assert (report.completed, report.failed) == (7, 0)
+    assert report.restarts == 1
+    assert len(report.workers) == 3  # two workers plus one replacement
+    assert 0 < report.totals["tasks_done"] <= 7
+
+
+class _LoggingTask:
+    async def run(self, broker):
+        from modern_python_demo.errors import logger
+
+        logger.error("logged from a worker")
+
+
+def test_supervisor_workers_keep_parent_logging(capfd):
+    from modern_python_demo import errors
+    from modern_python_demo.supervisor import Supervisor
+
+    errors.configure_logging()
+    try:
+        report = Supervisor(workers=1, concurrency=1, metrics_interval=0.05).run([_LoggingTask()])
+    finally:
+        errors.shutdown_logging()
+    assert report.completed == 1
+    assert "logged from a worker" in capfd.readouterr().err
+
+
+def test_sampling_profiler_attributes_samples_to_tasks():
+    import time
+    from modern_python_demo.profiler import SamplingProfiler
+
+    async def busy_task():
+        end = time.perf_counter() + 0.3
+        while time.perf_counter() < end:
+            sum(range(1000))
+
+    async def run():
+        await asyncio.create_task(busy_task(), name="busy")
+
+    with SamplingProfiler(interval=0.002, max_overhead=0.05) as prof:
+        asyncio.run(run())
+    assert prof.sample_count > 0
+    lines = prof.collapsed().splitlines()
+    assert any(ln.startswith("task:busy;") and "busy_task" in ln for ln in lines)
+    assert all(ln.rsplit(" ", 1)[1].isdigit() for ln in lines)
+
+    shallow = SamplingProfiler(max_depth=3)
+    shallow._sample(skip=-1)
+    deep = [s for s in shallow.samples if len(s) > 4]
+    assert deep and all(s[1] == "[truncated]" and len(s) == 5 for s in deep)
+
+
+def test_ipc_emit_subscribe_and_pool(tmp_path):
+    import socket
+
+    import pytest
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix domain sockets not available")
+    from modern_python_demo.errors import IPCError
+    from modern_python_demo.ipc import IPCClient, IPCClientPool, IPCServer
+
+    async def run():
+        broker = EventBroker()
+        seen = []
+        pushed = asyncio.Queue()
+
+        def on_order(event, payload):
+            seen.append(payload["n"])
+
+        def on_bad(event, payload):
+            raise ValueError("rejected")
+
+        broker.subscribe("order", on_order)
+        broker.subscribe("bad", on_bad)
+        path = str(tmp_path / "broker.sock")
+        async with IPCServer(broker, path):
+            async with IPCClient(path, window=4) as client:
+                await client.subscribe("order", lambda event, payload: pushed.put_nowait(payload["n"]))
+                acks = [await client.emit("order", {"n": i}) for i in range(20)]
+                await asyncio.gather(*acks)
+                with pytest.raises(IPCError, match="rejected"):
+                    await client.publish("bad", {})
+                first_push = await asyncio.wait_for(pushed.get(), 1)
+
+            async with IPCClientPool(path, size=2) as pool:
+                for i in range(20, 25):
+                    await pool.publish("order", {"n": i})
+                assert len(pool._all) == 1
+        return seen, first_push
+
+    seen, first_push = asyncio.run(run())
+    assert seen == list(range(25))
+    assert first_push == 0
+
+
+def test_ipc_client_survives_handler_errors_and_dropped_connections(tmp_path):
+    import socket
+
+    import pytest
+
+    if not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix domain sockets not available")
+    from modern_python_demo.ipc import IPCClient, IPCServer
+    from modern_python_demo.serialization import dumps_json
+
+    async def run():
+        broker = EventBroker()
+        release = asyncio.Event()
+
+        async def stall(event, payload):
+            await release.wait()
+
+        broker.subscribe("stall", stall)
+        path = str(tmp_path / "broker.sock")
+        echoed = asyncio.Queue()
+        async with IPCServer(broker, path), IPCClient(path, window=2) as client:
+
+            def raising(event, payload):
+                raise ValueError("handler bug")
+
+            async def republish(event, payload):
+                # publishing from a handler must not deadlock the client
+                await client.publish("echo", payload)
+
+            await client.subscribe("x", raising)
+            await client.subscribe("x", republish)
+            await client.subscribe("echo", lambda event, payload: echoed.put_nowait(payload))
+            await asyncio.wait_for(client.publish("x", {"n": 1}), 1)
+            assert await asyncio.wait_for(echoed.get(), 1) == {"n": 1}
+
+            in_flight = [await client.emit("stall", {}) for _ in range(2)]
+        # the server went away with both messages unacknowledged
+        results = await asyncio.gather(*in_flight, return_exceptions=True)
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+        async with IPCServer(broker, path):
+            await client.connect()
+            await asyncio.wait_for(client.publish("x", {"n": 2}), 1)
+            # subscriptions were restored on reconnect
+            assert await asyncio.wait_for(echoed.get(), 1) == {"n": 2}
+            await client.flush()
+            assert client._window._value == 2
+            await client.close()
+            with pytest.raises(ConnectionError):
+                await client.subscribe("y", lambda event, payload: None)
+            assert "y" not in client._handlers
+
+            with pytest.raises(FileExistsError):
+                await IPCServer(broker, path).start()
+        release.set()
+
+        # well-formed but wrongly shaped frames just close that connection
+        loop_errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, ctx: loop_errors.append(ctx))
+        async with IPCServer(broker, path):
+            for body in (dumps_json(None), dumps_json([1, 2]), '["not", "an envelope"]'):
+                reader, writer = await asyncio.open_unix_connection(path)
+                data = body.encode("utf8")
+                writer.write(len(data).to_bytes(4, "big") + data)
+                assert await asyncio.wait_for(reader.read(), 1) == b""
+                writer.close()
+        assert loop_errors == []
+
+        regular = tmp_path / "not-a-socket"
+        regular.write_text("keep me")
+        with pytest.raises(FileExistsError):
+            await IPCServer(broker, str(regular)).start()
+        assert regular.read_text() == "keep me"
+
+    asyncio.run(run())
@@ -1,5 +1,8 @@
 """Simple utility to bump the patch version in pyproject.toml.
 
+The package's ``_version.py`` is rewritten to match, so ``__version__`` does
+not need an ``importlib.metadata`` lookup at import time.
+
 Usage:
     python tools/bump_version.py --part patch
     python tools/bump_version.py --part minor
@@ -12,6 +15,7 @@ import re
 from pathlib import Path
 
 PYPROJECT = Path(__file__).resolve().parents[1] / "pyproject.toml"
+VERSION_PY = PYPROJECT.parent / "modern_python_demo" / "_version.py"
 
 RE = re.compile(r'^(version\s*=\s*")([0-9]+)\.([0-9]+)\.([0-9]+)(".*)$')
 
@@ -35,6 +39,10 @@ def bump_version(part: str) -> str:
             new = f'{m.group(1)}{major}.{minor}.{patch}{m.group(5)}'
             lines[i] = new
             PYPROJECT.write_text("\n".join(lines), encoding="utf8")
+            VERSION_PY.write_text(
+                re.sub(r'__version__ = "[^"]*"', f'__version__ = "{major}.{minor}.{patch}"', VERSION_PY.read_text(encoding="utf8")),
+                encoding="utf8",
+            )
             return f"{major}.{minor}.{patch}"
     raise RuntimeError("version not found in pyproject.toml")
 
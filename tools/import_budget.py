@@ -0,0 +1,69 @@
+"""Check the package's cold import time against a budget using ``-X importtime``.
+
+Usage:
+    python tools/import_budget.py
+    python tools/import_budget.py --module modern_python_demo.main --budget-ms 150 --runs 5
+
+Each run imports the module in a fresh interpreter; the fastest run is
+compared with the budget so one noisy run does not fail the check. Exits with
+status 1 when the budget is exceeded and prints the slowest imports.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# "import time:   self [us] | cumulative | imported package"
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """Map module name to ``(self_us, cumulative_us)`` from ``-X importtime`` output."""
+    timings: Dict[str, Tuple[int, int]] = {}
+    for ln in output.splitlines():
+        m = LINE.match(ln)
+        if m:
+            timings[m.group(4)] = (int(m.group(1)), int(m.group(2)))
+    return timings
+
+
+def measure(module: str) -> Dict[str, Tuple[int, int]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def main(argv: List[str] | None = None) -> int:
+    p = argparse.ArgumentParser()
+    p.add_argument("--module", default="modern_python_demo.main")
+    p.add_argument("--budget-ms", type=float, default=150.0)
+    p.add_argument("--runs", type=int, default=5)
+    p.add_argument("--top", type=int, default=10, help="slowest imports to show")
+    args = p.parse_args(argv)
+
+    runs = [measure(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda t: t[args.module][1])
+    total_ms = best[args.module][1] / 1000
+    print(f"import {args.module}: {total_ms:.1f} ms (best of {args.runs}, budget {args.budget_ms:.1f} ms)")
+    if total_ms <= args.budget_ms:
+        return 0
+    print("Slowest imports (self time):")
+    for name, (self_us, cum_us) in sorted(best.items(), key=lambda kv: kv[1][0], reverse=True)[: args.top]:
+        print(f"  {self_us / 1000:8.2f} ms  {cum_us / 1000:8.2f} ms cumulative  {name}")
+    print("Import-time budget exceeded")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())